@@ -15,6 +15,10 @@ setup(
         'terraform_aws_migrator': ['*', '**/*'],
     },
     install_requires=requirements,
+    extras_require={
+        # Faster JSON output for large result sets
+        "fast": ["orjson>=3.6"],
+    },
     entry_points={
         'console_scripts': [
             'terraform_aws_migrator=terraform_aws_migrator.main:main',
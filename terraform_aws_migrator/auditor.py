@@ -2,8 +2,6 @@
 
 import time
 from typing import Dict, List, Set, Any
-import boto3
-import traceback
 from rich.console import Console
 from rich.progress import (
     Progress,
@@ -14,7 +12,13 @@ from rich.progress import (
 )
 from rich.text import Text
 
-from terraform_aws_migrator.collectors.base import registry
+from terraform_aws_migrator.collectors.base import (
+    registry,
+    get_default_session,
+    TagCache,
+    MAX_WORKERS,
+    new_worker_pool,
+)
 from terraform_aws_migrator.state_reader import TerraformStateReader
 from terraform_aws_migrator.exclusion import ResourceExclusionConfig
 
@@ -41,13 +45,19 @@ class CompactTimeColumn(ProgressColumn):
 class AWSResourceAuditor:
     """Main class for detecting unmanaged AWS resources"""
 
-    def __init__(self, exclusion_file: str = None, target_resource_type: str = None):
-        self.session = boto3.Session()
+    def __init__(
+        self,
+        exclusion_file: str = None,
+        target_resource_type: str = None,
+        include_tags: bool = True,
+    ):
+        self.session = get_default_session()
         self.state_reader = TerraformStateReader(self.session)
         self.console = Console()
         self.start_time = None
         self.exclusion_config = ResourceExclusionConfig(exclusion_file)
         self.target_resource_type = target_resource_type
+        self.include_tags = include_tags
         self.resource_type_mappings = {}
 
     def get_terraform_managed_resources(self, tf_dir: str, progress=None) -> Set[str]:
@@ -66,12 +76,26 @@ class AWSResourceAuditor:
 
     def _get_relevant_collectors(self):
         """Get collectors based on target_resource_type"""
-        collectors = registry.get_collectors(self.session)
-
+        # Tagging API indexes are shared by the collectors of this run only
+        tag_cache = TagCache()
         if not self.target_resource_type:
-            logger.debug(f"Getting all collectors: {len(collectors)}")
+            collectors = registry.get_collectors(
+                self.session, include_tags=self.include_tags, tag_cache=tag_cache
+            )
+            logger.debug("Getting all collectors: %s", len(collectors))
             return collectors
 
+        # Only the collector that owns the type needs to run, e.g. aws_lb is
+        # owned by the elbv2 collector although its name suggests "lb"
+        collector_cls = registry.get_collector_class(self.target_resource_type)
+        if collector_cls is not None:
+            self.resource_type_mappings.update(collector_cls.get_resource_types())
+            return [
+                collector_cls(
+                    self.session, include_tags=self.include_tags, tag_cache=tag_cache
+                )
+            ]
+
         # aws_iam_role_policy_attachment -> "iam"
         parts = self.target_resource_type.split("_")
         if len(parts) < 2:
@@ -80,16 +104,27 @@ class AWSResourceAuditor:
 
         # "aws_iam_*" -> "iam"
         service_name = parts[1]
-        logger.debug(
-            f"Looking for collectors for service: {service_name} - Found: {[c.__class__.__name__ for c in collectors]}"
+        collectors = registry.get_collectors(
+            self.session,
+            service_name,
+            include_tags=self.include_tags,
+            tag_cache=tag_cache,
         )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Looking for collectors for service: %s - Found: %s",
+                service_name,
+                [c.__class__.__name__ for c in collectors],
+            )
 
         for collector in collectors:
-            logger.debug(f"Checking collector: {collector.__class__.__name__}")
+            logger.debug("Checking collector: %s", collector.__class__.__name__)
             if collector.get_service_name() == service_name:
                 self.resource_type_mappings.update(collector.get_resource_types())
                 logger.debug(
-                    f"Updated mappings from {collector.__class__.__name__}: {collector.get_resource_types()}"
+                    "Updated mappings from %s: %s",
+                    collector.__class__.__name__,
+                    collector.get_resource_types(),
                 )
 
         relevant_collectors = [
@@ -153,13 +188,11 @@ class AWSResourceAuditor:
                         unmanaged_resources[unmanaged["id"]] = unmanaged
 
                     logger.debug(
-                        f"After filtering: {len(unmanaged_resources)} unmanaged resources for {self.target_resource_type}"
+                        "After filtering: %s unmanaged resources for %s",
+                        len(unmanaged_resources),
+                        self.target_resource_type,
                     )
 
-                    # if self.target_resource_type not in unmanaged:
-                    #     unmanaged_resources[self.target_resource_type] = []
-                    # unmanaged_resources[self.target_resource_type].extend(unmanaged)
-                    
                     for resource_type, resources in self._group_by_type(unmanaged_resources):
                         display_name = self.resource_type_mappings.get(
                             resource_type, resource_type
@@ -169,8 +202,10 @@ class AWSResourceAuditor:
                         )
 
                 except Exception as e:
-                    logger.error(f"Error collecting {self.target_resource_type} resources: {str(e)}")
-                    self.console.print(f"[red]Error during detection: {traceback.format_exc()}")
+                    logger.exception(
+                        "Error collecting %s resources", self.target_resource_type
+                    )
+                    self.console.print(f"[red]Error during detection: {str(e)}")
 
             progress.update(aws_task, completed=True)
 
@@ -219,58 +254,76 @@ class AWSResourceAuditor:
                 f"Found {len(managed_resources)} managed resources in Terraform state {get_elapsed_time()}"
             )
 
-            # Initialize collectors
-            collectors = [collector_cls(self.session) for collector_cls in registry]
+            # Initialize collectors, sharing Tagging API indexes for this run
+            tag_cache = TagCache()
+            collectors = [
+                collector_cls(
+                    self.session, include_tags=self.include_tags, tag_cache=tag_cache
+                )
+                for collector_cls in registry
+            ]
 
             # Add main AWS resource collection task
             aws_task = progress.add_task(
                 "[cyan]Collecting AWS resources...", total=None
             )
 
-            # Process each collector
-            for collector in collectors:
-                service_name = collector.get_service_name()
-                try:
-                    # Update progress description
-                    resource_types = collector.get_resource_types()
-                    resource_type_names = ", ".join(resource_types.values())
-                    progress.update(
-                        aws_task,
-                        description=f"[cyan]Collecting {resource_type_names}...",
-                    )
-
-                    # Collect resources
-                    resources = collector.collect()
-                    # Filter unmanaged resources
-                    unmanaged = self._filter_unmanaged_resources(
-                        resources, managed_resources
-                    )
-
-                    if unmanaged:
-                        type_groups = {}
-                        for resource in unmanaged:
-                            resource_type = resource.get("type", "unknown")
-                            if resource_type not in type_groups:
-                                type_groups[resource_type] = []
-                            type_groups[resource_type].append(resource)
-
-                        for resource_type, resources_list in type_groups.items():
-                            display_name = collector.get_type_display_name(
-                                resource_type
-                            )
-                            self.console.print(
-                                f"[green]Found {len(resources_list)} unmanaged {display_name} {get_elapsed_time()}"
-                            )
-
-                        # unmanaged_resourcesに追加
-                        if service_name not in unmanaged_resources:
-                            unmanaged_resources[service_name] = []
-                        unmanaged_resources[service_name].extend(unmanaged)
+            def collect(collector):
+                # Update progress description as each collector starts
+                resource_type_names = ", ".join(
+                    collector.get_resource_types().values()
+                )
+                progress.update(
+                    aws_task,
+                    description=f"[cyan]Collecting {resource_type_names}...",
+                )
+                return collector.collect()
+
+            # Collectors mostly wait on AWS APIs, so run them concurrently and
+            # handle their results in registration order. Their own fan-outs run
+            # serially inside the pool, bounding the threads to max_workers.
+            max_workers = max(1, min(MAX_WORKERS, len(collectors)))
+            with new_worker_pool(max_workers) as executor:
+                futures = [
+                    executor.submit(collect, collector) for collector in collectors
+                ]
+
+                # Process each collector
+                for collector, future in zip(collectors, futures):
+                    service_name = collector.get_service_name()
+                    try:
+                        # Collect resources
+                        resources = future.result()
+                        # Filter unmanaged resources
+                        unmanaged = self._filter_unmanaged_resources(
+                            resources, managed_resources
+                        )
 
-                except Exception as e:
-                    self.console.print(
-                        f"[red]Error collecting {service_name} resources: {str(e)}"
-                    )
+                        if unmanaged:
+                            type_groups = {}
+                            for resource in unmanaged:
+                                resource_type = resource.get("type", "unknown")
+                                if resource_type not in type_groups:
+                                    type_groups[resource_type] = []
+                                type_groups[resource_type].append(resource)
+
+                            for resource_type, resources_list in type_groups.items():
+                                display_name = collector.get_type_display_name(
+                                    resource_type
+                                )
+                                self.console.print(
+                                    f"[green]Found {len(resources_list)} unmanaged {display_name} {get_elapsed_time()}"
+                                )
+
+                            # unmanaged_resourcesに追加
+                            if service_name not in unmanaged_resources:
+                                unmanaged_resources[service_name] = []
+                            unmanaged_resources[service_name].extend(unmanaged)
+
+                    except Exception as e:
+                        self.console.print(
+                            f"[red]Error collecting {service_name} resources: {str(e)}"
+                        )
 
             # Complete the collection task
             progress.update(aws_task, completed=True)
@@ -289,12 +342,9 @@ class AWSResourceAuditor:
     def _filter_unmanaged_resources(self, resources: List[Dict[str, Any]], managed_resources: Set[str]) -> List[Dict[str, Any]]:
         """Filter out resources that are managed by Terraform or explicitly excluded"""
         unmanaged = []
-        # for mr in managed_resources:
-        #     self.console.print(f"mr {mr}")
 
         for resource in resources:
             identifier = self._get_resource_identifiers(resource)
-            # self.console.print(f"i {identifier}")
             if identifier not in managed_resources:
                 if not self.exclusion_config.should_exclude(resource):
                     if self.target_resource_type:
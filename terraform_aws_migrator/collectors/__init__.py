@@ -1,18 +1,17 @@
 # terraform_aws_migrator/collectors/__init__.py
 
-from .base import ResourceCollector, register_collector
-from .aws_compute import *
-from .aws_database import *
-from .aws_network import *
-from .aws_security import *
-from .aws_storage import *
-from .aws_application import *
-from .aws_iam.role import IAMRoleCollector
-from .aws_iam.user import IAMUserCollector
-from .aws_iam.group import IAMGroupCollector
-from .aws_iam.policy import IAMPolicyCollector
+from .base import ResourceCollector, register_collector, registry
 
 __all__ = [
     'ResourceCollector',
     'register_collector'
 ]
+
+
+def __getattr__(name):
+    # Collector classes (e.g. IAMRoleCollector) are resolved from the registry,
+    # which imports the collector modules on first use
+    for collector_cls in registry:
+        if collector_cls.__name__ == name:
+            return collector_cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
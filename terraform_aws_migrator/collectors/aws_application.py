@@ -1,7 +1,15 @@
 # terraform_aws_migrator/collectors/aws_application.py
 
 from typing import Dict, List, Any
+from botocore.exceptions import BotoCoreError, ClientError
 from .base import ResourceCollector, register_collector
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Largest page size accepted by Step Functions ListStateMachines (the default
+# is 100)
+SFN_PAGINATION_CONFIG = {"PageSize": 1000}
 
 
 @register_collector
@@ -17,18 +25,22 @@ class StepFunctionCollector(ResourceCollector):
     def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
         try:
-            paginator = self.client.get_paginator("list_state_machines")
-            for page in paginator.paginate():
+            paginator = self.get_paginator("list_state_machines")
+            for page in paginator.paginate(PaginationConfig=SFN_PAGINATION_CONFIG):
                 for state_machine in page["stateMachines"]:
                     # Get detailed information about the state machine
                     try:
                         details = self.client.describe_state_machine(
                             stateMachineArn=state_machine["stateMachineArn"]
                         )
-                        tags = self.client.list_tags_for_resource(
-                            resourceArn=state_machine["stateMachineArn"]
-                        ).get("tags", [])
-                    except Exception:
+                        tags = (
+                            self.client.list_tags_for_resource(
+                                resourceArn=state_machine["stateMachineArn"]
+                            ).get("tags", [])
+                            if self.include_tags
+                            else []
+                        )
+                    except (BotoCoreError, ClientError):
                         details = {}
                         tags = []
 
@@ -46,7 +58,7 @@ class StepFunctionCollector(ResourceCollector):
                             },
                         }
                     )
-        except Exception as e:
-            print(f"Error collecting Step Functions: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting Step Functions")
 
         return resources
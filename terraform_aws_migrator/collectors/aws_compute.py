@@ -1,7 +1,9 @@
 # terraform_aws_migrator/collectors/aws_compute.py
 
 from typing import Dict, List, Any
-from .base import ResourceCollector, register_collector
+import itertools
+from botocore.exceptions import BotoCoreError, ClientError
+from .base import ResourceCollector, register_collector, matches_target
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,50 +25,80 @@ class EC2Collector(ResourceCollector):
 
     def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
-
+        stages = {
+            "aws_instance": self._collect_instances,
+            "aws_vpc": self._collect_vpcs,
+            "aws_security_group": self._collect_security_groups,
+        }
+        if target_resource_type:
+            stages = {
+                resource_type: stage
+                for resource_type, stage in stages.items()
+                if resource_type == target_resource_type
+            }
         try:
-            # EC2 instances
-            paginator = self.client.get_paginator("describe_instances")
-            for page in paginator.paginate():
-                for reservation in page["Reservations"]:
-                    for instance in reservation["Instances"]:
-                        resources.append(
-                            {
-                                "type": "aws_instance",
-                                "id": instance["InstanceId"],
-                                "arn": self.build_arn(
-                                    "instance", instance["InstanceId"]
-                                ),
-                                "tags": instance.get("Tags", []),
-                            }
-                        )
-
-            # VPCs
-            for vpc in self.client.describe_vpcs()["Vpcs"]:
-                resources.append(
-                    {
-                        "type": "aws_vpc",
-                        "id": vpc["VpcId"],
-                        "arn": self.build_arn("vpc", vpc["VpcId"]),
-                        "tags": vpc.get("Tags", []),
-                    }
+            # Each stage is a separate Describe* call, so they run concurrently
+            resources.extend(
+                itertools.chain.from_iterable(
+                    self.parallel_map(lambda stage: stage(), list(stages.values()))
                 )
+            )
+        except Exception:
+            logger.exception("Error collecting EC2 resources")
 
-            # Security Groups
-            for sg in self.client.describe_security_groups()["SecurityGroups"]:
-                resources.append(
-                    {
-                        "type": "aws_security_group",
-                        "id": sg["GroupId"],
-                        "arn": self.build_arn("security-group", sg["GroupId"]),
-                        "tags": sg.get("Tags", []),
-                    }
-                )
+        return resources
 
-        except Exception as e:
-            logger.error(f"Error collecting EC2 resources: {str(e)}")
+    def _collect_instances(self) -> List[Dict[str, Any]]:
+        """Collect EC2 instances"""
+        try:
+            paginator = self.get_paginator("describe_instances")
+            return [
+                {
+                    "type": "aws_instance",
+                    "id": instance["InstanceId"],
+                    "arn": self.build_arn("instance", instance["InstanceId"]),
+                    "tags": instance.get("Tags", []),
+                }
+                for page in paginator.paginate()
+                for reservation in page["Reservations"]
+                for instance in reservation["Instances"]
+            ]
+        except Exception:
+            logger.exception("Error collecting EC2 instances")
+            return []
+
+    def _collect_vpcs(self) -> List[Dict[str, Any]]:
+        """Collect VPCs"""
+        try:
+            return [
+                {
+                    "type": "aws_vpc",
+                    "id": vpc["VpcId"],
+                    "arn": self.build_arn("vpc", vpc["VpcId"]),
+                    "tags": vpc.get("Tags", []),
+                }
+                for vpc in self.client.describe_vpcs()["Vpcs"]
+            ]
+        except Exception:
+            logger.exception("Error collecting VPCs")
+            return []
+
+    def _collect_security_groups(self) -> List[Dict[str, Any]]:
+        """Collect security groups"""
+        try:
+            return [
+                {
+                    "type": "aws_security_group",
+                    "id": sg["GroupId"],
+                    "arn": self.build_arn("security-group", sg["GroupId"]),
+                    "tags": sg.get("Tags", []),
+                }
+                for sg in self.client.describe_security_groups()["SecurityGroups"]
+            ]
+        except Exception:
+            logger.exception("Error collecting security groups")
+            return []
 
-        return resources
 
 @register_collector
 class ECSCollector(ResourceCollector):
@@ -78,47 +110,53 @@ class ECSCollector(ResourceCollector):
     def get_resource_types(self) -> Dict[str, str]:
         return {"aws_ecs_cluster": "ECS Clusters", "aws_ecs_service": "ECS Services"}
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
-            # Clusters
-            cluster_arns = self.client.list_clusters()["clusterArns"]
-            if cluster_arns:
-                clusters = self.client.describe_clusters(clusters=cluster_arns)[
-                    "clusters"
-                ]
-                for cluster in clusters:
-                    resources.append(
-                        {
-                            "type": "cluster",
-                            "id": cluster["clusterName"],
-                            "arn": cluster["clusterArn"],
-                            "tags": cluster.get("tags", []),
-                        }
-                    )
-
-                    # Services in each cluster
-                    paginator = self.client.get_paginator("list_services")
-                    for page in paginator.paginate(cluster=cluster["clusterName"]):
-                        service_arns = page["serviceArns"]
-                        if service_arns:
-                            services = self.client.describe_services(
-                                cluster=cluster["clusterName"], services=service_arns
-                            )["services"]
-                            for service in services:
-                                resources.append(
-                                    {
-                                        "type": "service",
-                                        "id": service["serviceName"],
-                                        "arn": service["serviceArn"],
-                                        "cluster": cluster["clusterName"],
-                                        "tags": service.get("tags", []),
-                                    }
-                                )
-
-        except Exception as e:
-            logger.error(f"Error collecting ECS resources: {str(e)}")
+            # Clusters, in pages of up to 100 (the DescribeClusters limit)
+            cluster_paginator = self.get_paginator("list_clusters")
+            for cluster_page in cluster_paginator.paginate():
+                cluster_arns = cluster_page["clusterArns"]
+                if cluster_arns:
+                    clusters = self.client.describe_clusters(clusters=cluster_arns)[
+                        "clusters"
+                    ]
+                    for cluster in clusters:
+                        if matches_target("aws_ecs_cluster", target_resource_type):
+                            resources.append(
+                                {
+                                    "type": "aws_ecs_cluster",
+                                    "id": cluster["clusterName"],
+                                    "arn": cluster["clusterArn"],
+                                    "tags": cluster.get("tags", []),
+                                }
+                            )
+
+                        # Services in each cluster
+                        if not matches_target("aws_ecs_service", target_resource_type):
+                            continue
+                        paginator = self.get_paginator("list_services")
+                        for page in paginator.paginate(cluster=cluster["clusterName"]):
+                            service_arns = page["serviceArns"]
+                            if service_arns:
+                                services = self.client.describe_services(
+                                    cluster=cluster["clusterName"],
+                                    services=service_arns,
+                                )["services"]
+                                for service in services:
+                                    resources.append(
+                                        {
+                                            "type": "aws_ecs_service",
+                                            "id": service["serviceName"],
+                                            "arn": service["serviceArn"],
+                                            "cluster": cluster["clusterName"],
+                                            "tags": service.get("tags", []),
+                                        }
+                                    )
+
+        except Exception:
+            logger.exception("Error collecting ECS resources")
 
         return resources
 
@@ -133,19 +171,21 @@ class LambdaCollector(ResourceCollector):
     def get_resource_types(self) -> Dict[str, str]:
         return {"aws_lambda_function": "Lambda Functions"}
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
         try:
-            paginator = self.client.get_paginator("list_functions")
+            paginator = self.get_paginator("list_functions")
             for page in paginator.paginate():
                 for function in page["Functions"]:
                     # Get function tags
-                    try:
-                        tags = self.client.list_tags(
-                            Resource=function["FunctionArn"]
-                        ).get("Tags", {})
-                    except Exception:
-                        tags = {}
+                    tags = {}
+                    if self.include_tags:
+                        try:
+                            tags = self.client.list_tags(
+                                Resource=function["FunctionArn"]
+                            ).get("Tags", {})
+                        except (BotoCoreError, ClientError):
+                            tags = {}
 
                     resources.append(
                         {
@@ -165,7 +205,7 @@ class LambdaCollector(ResourceCollector):
                             },
                         }
                     )
-        except Exception as e:
-            print(f"Error collecting Lambda functions: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting Lambda functions")
 
         return resources
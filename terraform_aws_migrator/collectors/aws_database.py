@@ -1,7 +1,10 @@
 # resource_collectors/database.py
 
 from typing import Dict, List, Any
-from .base import ResourceCollector, register_collector
+from .base import ResourceCollector, register_collector, matches_target
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 @register_collector
@@ -22,38 +25,48 @@ class RDSCollector(ResourceCollector):
 
         try:
             # DB instances
-            paginator = self.client.get_paginator("describe_db_instances")
-            for page in paginator.paginate():
-                for instance in page["DBInstances"]:
-                    resources.append(
-                        {
-                            "type": "instance",
-                            "id": instance["DBInstanceIdentifier"],
-                            "arn": instance["DBInstanceArn"],
-                            "engine": instance["Engine"],
-                            "tags": self.client.list_tags_for_resource(
-                                ResourceName=instance["DBInstanceArn"]
-                            )["TagList"],
-                        }
-                    )
+            if matches_target("aws_db_instance", target_resource_type):
+                paginator = self.get_paginator("describe_db_instances")
+                for page in paginator.paginate():
+                    for instance in page["DBInstances"]:
+                        resources.append(
+                            {
+                                "type": "aws_db_instance",
+                                "id": instance["DBInstanceIdentifier"],
+                                "arn": instance["DBInstanceArn"],
+                                "engine": instance["Engine"],
+                                "tags": (
+                                    self.client.list_tags_for_resource(
+                                        ResourceName=instance["DBInstanceArn"]
+                                    )["TagList"]
+                                    if self.include_tags
+                                    else []
+                                ),
+                            }
+                        )
 
             # DB clusters
-            paginator = self.client.get_paginator("describe_db_clusters")
-            for page in paginator.paginate():
-                for cluster in page["DBClusters"]:
-                    resources.append(
-                        {
-                            "type": "cluster",
-                            "id": cluster["DBClusterIdentifier"],
-                            "arn": cluster["DBClusterArn"],
-                            "engine": cluster["Engine"],
-                            "tags": self.client.list_tags_for_resource(
-                                ResourceName=cluster["DBClusterArn"]
-                            )["TagList"],
-                        }
-                    )
-        except Exception as e:
-            print(f"Error collecting RDS resources: {str(e)}")
+            if matches_target("aws_rds_cluster", target_resource_type):
+                paginator = self.get_paginator("describe_db_clusters")
+                for page in paginator.paginate():
+                    for cluster in page["DBClusters"]:
+                        resources.append(
+                            {
+                                "type": "aws_rds_cluster",
+                                "id": cluster["DBClusterIdentifier"],
+                                "arn": cluster["DBClusterArn"],
+                                "engine": cluster["Engine"],
+                                "tags": (
+                                    self.client.list_tags_for_resource(
+                                        ResourceName=cluster["DBClusterArn"]
+                                    )["TagList"]
+                                    if self.include_tags
+                                    else []
+                                ),
+                            }
+                        )
+        except Exception:
+            logger.exception("Error collecting RDS resources")
 
         return resources
 
@@ -70,28 +83,32 @@ class DynamoDBCollector(ResourceCollector):
             "aws_dynamodb_table": "DynamoDB Tables"
         }
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
-            paginator = self.client.get_paginator("list_tables")
+            paginator = self.get_paginator("list_tables")
             for page in paginator.paginate():
                 for table_name in page["TableNames"]:
                     table = self.client.describe_table(TableName=table_name)["Table"]
-                    tags = self.client.list_tags_of_resource(
-                        ResourceArn=f"arn:aws:dynamodb:{self.session.region_name}:{self.session.client('sts').get_caller_identity()['Account']}:table/{table_name}"
-                    ).get("Tags", [])
+                    tags = (
+                        self.client.list_tags_of_resource(
+                            ResourceArn=table["TableArn"]
+                        ).get("Tags", [])
+                        if self.include_tags
+                        else []
+                    )
 
                     resources.append(
                         {
-                            "type": "table",
+                            "type": "aws_dynamodb_table",
                             "id": table_name,
                             "arn": table["TableArn"],
                             "tags": tags,
                         }
                     )
-        except Exception as e:
-            print(f"Error collecting DynamoDB tables: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting DynamoDB tables")
 
         return resources
 
@@ -109,42 +126,59 @@ class ElastiCacheCollector(ResourceCollector):
             "aws_elasticache_replication_group": "ElastiCache Replication Groups"
         }
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
+            arn_prefix = f"arn:aws:elasticache:{self.region}:{self.account_id}:"
+
             # Cache clusters
-            paginator = self.client.get_paginator("describe_cache_clusters")
-            for page in paginator.paginate():
-                for cluster in page["CacheClusters"]:
-                    resources.append(
-                        {
-                            "type": "cluster",
-                            "id": cluster["CacheClusterId"],
-                            "arn": f"arn:aws:elasticache:{self.session.region_name}:{self.session.client('sts').get_caller_identity()['Account']}:cluster:{cluster['CacheClusterId']}",
-                            "engine": cluster["Engine"],
-                            "tags": self.client.list_tags_for_resource(
-                                ResourceName=f"arn:aws:elasticache:{self.session.region_name}:{self.session.client('sts').get_caller_identity()['Account']}:cluster:{cluster['CacheClusterId']}"
-                            )["TagList"],
-                        }
-                    )
+            if matches_target("aws_elasticache_cluster", target_resource_type):
+                paginator = self.get_paginator("describe_cache_clusters")
+                for page in paginator.paginate():
+                    for cluster in page["CacheClusters"]:
+                        arn = arn_prefix + "cluster:" + cluster["CacheClusterId"]
+                        resources.append(
+                            {
+                                "type": "aws_elasticache_cluster",
+                                "id": cluster["CacheClusterId"],
+                                "arn": arn,
+                                "engine": cluster["Engine"],
+                                "tags": (
+                                    self.client.list_tags_for_resource(
+                                        ResourceName=arn
+                                    )["TagList"]
+                                    if self.include_tags
+                                    else []
+                                ),
+                            }
+                        )
 
             # Replication groups
-            paginator = self.client.get_paginator("describe_replication_groups")
-            for page in paginator.paginate():
-                for group in page["ReplicationGroups"]:
-                    resources.append(
-                        {
-                            "type": "replication_group",
-                            "id": group["ReplicationGroupId"],
-                            "arn": f"arn:aws:elasticache:{self.session.region_name}:{self.session.client('sts').get_caller_identity()['Account']}:replicationgroup:{group['ReplicationGroupId']}",
-                            "tags": self.client.list_tags_for_resource(
-                                ResourceName=f"arn:aws:elasticache:{self.session.region_name}:{self.session.client('sts').get_caller_identity()['Account']}:replicationgroup:{group['ReplicationGroupId']}"
-                            )["TagList"],
-                        }
-                    )
-        except Exception as e:
-            print(f"Error collecting ElastiCache resources: {str(e)}")
+            if matches_target(
+                "aws_elasticache_replication_group", target_resource_type
+            ):
+                paginator = self.get_paginator("describe_replication_groups")
+                for page in paginator.paginate():
+                    for group in page["ReplicationGroups"]:
+                        group_id = group["ReplicationGroupId"]
+                        arn = arn_prefix + "replicationgroup:" + group_id
+                        resources.append(
+                            {
+                                "type": "aws_elasticache_replication_group",
+                                "id": group_id,
+                                "arn": arn,
+                                "tags": (
+                                    self.client.list_tags_for_resource(
+                                        ResourceName=arn
+                                    )["TagList"]
+                                    if self.include_tags
+                                    else []
+                                ),
+                            }
+                        )
+        except Exception:
+            logger.exception("Error collecting ElastiCache resources")
 
         return resources
 
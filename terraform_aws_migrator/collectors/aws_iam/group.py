@@ -1,13 +1,29 @@
 # terraform_aws_migrator/collectors/aws_iam/group.py
 
-from typing import Dict, List, Any
-from terraform_aws_migrator.collectors.base import ResourceCollector, register_collector
+from typing import Dict, List, Any, Iterator, Optional, TypedDict
+from botocore.exceptions import BotoCoreError, ClientError
+from ..base import (
+    ResourceCollector,
+    register_collector,
+    IAM_PAGINATION_CONFIG,
+    matches_target,
+    safe_collect,
+)
+from .authorization_details import iter_authorization_details
 import logging
-from ..base import ResourceCollector, register_collector
 
 logger = logging.getLogger(__name__)
 
 
+class IAMGroupRecord(TypedDict):
+    """Record collected for an aws_iam_group"""
+
+    type: str
+    id: str
+    arn: str
+    details: Dict[str, Any]
+
+
 @register_collector
 class IAMGroupCollector(ResourceCollector):
     @classmethod
@@ -26,57 +42,112 @@ class IAMGroupCollector(ResourceCollector):
     def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources: List = []
         try:
-            if target_resource_type != "aws_iam_group":
+            if not matches_target("aws_iam_group", target_resource_type):
                 return resources
-            # Collect IAM groups
-            paginator = self.client.get_paginator("list_groups")
-            for page in paginator.paginate():
-                for group in page["Groups"]:
-                    try:
-                        group_name = group["GroupName"]
-
-                        # Get group members
-                        members = self.client.get_group(GroupName=group_name)["Users"]
-
-                        # Get attached policies
-                        attached_policies = self.client.list_attached_group_policies(
-                            GroupName=group_name
-                        )["AttachedPolicies"]
-
-                        # Get inline policies
-                        inline_policies = self.client.list_group_policies(
-                            GroupName=group_name
-                        )["PolicyNames"]
-
-                        inline_policy_documents = {}
-                        for policy_name in inline_policies:
-                            policy = self.client.get_group_policy(
-                                GroupName=group_name, PolicyName=policy_name
-                            )
-                            inline_policy_documents[policy_name] = policy[
-                                "PolicyDocument"
-                            ]
-
-                        resources.append(
-                            {
-                                "type": "aws_iam_group",
-                                "id": group_name,
-                                "arn": group["Arn"],
-                                "details": {
-                                    "path": group["Path"],
-                                    "members": [user["UserName"] for user in members],
-                                    "attached_policies": attached_policies,
-                                    "inline_policies": inline_policy_documents,
-                                },
-                            }
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error collecting details for group {group['GroupName']}: {str(e)}"
-                        )
-                        continue
-
-        except Exception as e:
-            logger.error(f"Error collecting IAM group resources: {str(e)}")
+            resources.extend(self._collect_groups())
+        except Exception:
+            logger.exception("Error collecting IAM group resources")
 
         return resources
+
+    def _collect_groups(self) -> Iterator[IAMGroupRecord]:
+        """Collect IAM groups with their members and policies"""
+        try:
+            groups = list(
+                iter_authorization_details(self.client, "Group", "GroupDetailList")
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.warning(
+                "Account authorization details unavailable, using per-group calls: %s",
+                e,
+            )
+            yield from self._collect_groups_per_group()
+            return
+
+        # Account authorization details omit group membership
+        group_names = [group["GroupName"] for group in groups]
+        members_by_group = dict(
+            zip(group_names, self.parallel_map(self._get_group_members, group_names))
+        )
+
+        for group in groups:
+            members = members_by_group[group["GroupName"]]
+            if members is None:
+                continue
+
+            yield {
+                "type": "aws_iam_group",
+                "id": group["GroupName"],
+                "arn": group["Arn"],
+                "details": {
+                    "path": group["Path"],
+                    "members": members,
+                    "attached_policies": group.get("AttachedManagedPolicies", []),
+                    "inline_policies": {
+                        policy["PolicyName"]: policy["PolicyDocument"]
+                        for policy in group.get("GroupPolicyList", [])
+                    },
+                },
+            }
+
+    @safe_collect("Error collecting members for group %s")
+    def _get_group_members(self, group_name: str) -> Optional[List[str]]:
+        """Get the user names of a group's members, or None on failure"""
+        paginator = self.get_paginator("get_group")
+        return [
+            user["UserName"]
+            for page in paginator.paginate(
+                GroupName=group_name, PaginationConfig=IAM_PAGINATION_CONFIG
+            )
+            for user in page["Users"]
+        ]
+
+    def _collect_groups_per_group(self) -> Iterator[IAMGroupRecord]:
+        """Collect IAM groups with one set of IAM calls per group"""
+        paginator = self.get_paginator("list_groups")
+        for page in paginator.paginate(PaginationConfig=IAM_PAGINATION_CONFIG):
+            for group in page["Groups"]:
+                try:
+                    group_name = group["GroupName"]
+
+                    # Get group members
+                    members = self.client.get_group(GroupName=group_name)["Users"]
+
+                    # Get attached policies
+                    attached_policies = self.client.list_attached_group_policies(
+                        GroupName=group_name
+                    )["AttachedPolicies"]
+
+                    # Get inline policies
+                    inline_policies = self.client.list_group_policies(
+                        GroupName=group_name
+                    )["PolicyNames"]
+
+                    policy_documents = self.parallel_map(
+                        lambda policy_name: self.client.get_group_policy(
+                            GroupName=group_name, PolicyName=policy_name
+                        )["PolicyDocument"],
+                        inline_policies,
+                    )
+                    inline_policy_documents = dict(
+                        zip(inline_policies, policy_documents)
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Error collecting details for group %s: %s",
+                        group["GroupName"],
+                        e,
+                    )
+                    continue
+
+                yield {
+                    "type": "aws_iam_group",
+                    "id": group_name,
+                    "arn": group["Arn"],
+                    "details": {
+                        "path": group["Path"],
+                        "members": [user["UserName"] for user in members],
+                        "attached_policies": attached_policies,
+                        "inline_policies": inline_policy_documents,
+                    },
+                }
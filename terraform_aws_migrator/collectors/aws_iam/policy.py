@@ -1,12 +1,44 @@
 # terraform_aws_migrator/collectors/aws_iam/policy.py
 
-from typing import Dict, List, Any
-from ..base import ResourceCollector, register_collector
+from typing import Dict, List, Any, Iterator, Optional, TypedDict
+from botocore.exceptions import BotoCoreError, ClientError
+from ..base import (
+    ResourceCollector,
+    register_collector,
+    GLOBAL_SERVICE_REGION,
+    IAM_PAGINATION_CONFIG,
+    safe_collect,
+)
+from .authorization_details import iter_authorization_details
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class IAMPolicyRecord(TypedDict):
+    """Record collected for an aws_iam_policy"""
+
+    type: str
+    id: str
+    arn: str
+    tags: List[Dict[str, str]]
+    details: Dict[str, Any]
+
+
+@functools.lru_cache(maxsize=4096)
+def _fetch_policy_version(client, policy_arn: str, version_id: str) -> Dict[str, Any]:
+    """
+    Fetch a policy version, cached per client.
+
+    Policy versions are immutable (editing a policy creates a new version id),
+    so cached entries never go stale and need no expiry.
+    """
+    return client.get_policy_version(PolicyArn=policy_arn, VersionId=version_id)[
+        "PolicyVersion"
+    ]
+
+
 @register_collector
 class IAMPolicyCollector(ResourceCollector):
     """Collector for IAM Policies"""
@@ -37,28 +69,59 @@ class IAMPolicyCollector(ResourceCollector):
             return []
 
         try:
-            return self._collect_customer_managed_policies()
-        except Exception as e:
-            logger.error(f"Error collecting IAM policy resources: {e}")
+            return list(self._collect_customer_managed_policies())
+        except Exception:
+            logger.exception("Error collecting IAM policy resources")
             return []
 
-    def _collect_customer_managed_policies(self) -> List[Dict[str, Any]]:
+    def _collect_customer_managed_policies(self) -> Iterator[IAMPolicyRecord]:
         """Collect customer managed IAM policies"""
-        resources = []
-        paginator = self.client.get_paginator("list_policies")
-
         try:
-            for page in paginator.paginate(Scope="Local"):
-                for policy in page["Policies"]:
-                    policy_resource = self._process_single_policy(policy)
-                    if policy_resource:
-                        resources.append(policy_resource)
+            policies = self._list_customer_managed_policies()
+            # Warm the tag index before the fan-out so workers share one lookup
+            if self.include_tags:
+                self.get_tags_by_arn(
+                    ["iam:policy"], region_name=GLOBAL_SERVICE_REGION
+                )
+
+            for policy_resource in self.parallel_map(
+                self._process_single_policy, policies
+            ):
+                if policy_resource:
+                    yield policy_resource
         except Exception as e:
-            logger.error(f"Error during policy collection: {e}")
+            logger.error("Error during policy collection: %s", e)
 
-        return resources
+    def _list_customer_managed_policies(self) -> List[Dict[str, Any]]:
+        """
+        List customer managed policies.
 
-    def _process_single_policy(self, policy: Dict[str, Any]) -> Dict[str, Any]:
+        Account authorization details return every version of each policy
+        with its document, so no per-policy get_policy_version call is needed.
+        If that call is not permitted, list_policies is used instead.
+        """
+        try:
+            return list(
+                iter_authorization_details(self.client, "LocalManagedPolicy", "Policies")
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.warning(
+                "Account authorization details unavailable, using per-policy calls: %s",
+                e,
+            )
+
+        paginator = self.get_paginator("list_policies")
+        return [
+            policy
+            for page in paginator.paginate(
+                Scope="Local", PaginationConfig=IAM_PAGINATION_CONFIG
+            )
+            for policy in page["Policies"]
+        ]
+
+    def _process_single_policy(
+        self, policy: Dict[str, Any]
+    ) -> Optional[IAMPolicyRecord]:
         """
         Process a single IAM policy and format its data
         
@@ -70,7 +133,7 @@ class IAMPolicyCollector(ResourceCollector):
         """
         try:
             policy_arn = policy["Arn"]
-            policy_version = self._get_policy_version(policy_arn, policy["DefaultVersionId"])
+            policy_version = self._get_default_policy_version(policy)
             tags = self._get_policy_tags(policy_arn)
 
             return {
@@ -89,23 +152,39 @@ class IAMPolicyCollector(ResourceCollector):
                 },
             }
         except Exception as e:
-            logger.error(f"Error processing policy {policy.get('PolicyName', 'Unknown')}: {e}")
+            logger.error(
+                "Error processing policy %s: %s",
+                policy.get("PolicyName", "Unknown"),
+                e,
+            )
             return None
 
+    def _get_default_policy_version(self, policy: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the default version of a policy, fetching it only if not already listed"""
+        for version in policy.get("PolicyVersionList", []):
+            if version["IsDefaultVersion"]:
+                return version
+        return self._get_policy_version(policy["Arn"], policy["DefaultVersionId"])
+
+    @safe_collect(
+        "Error getting policy version for %s (version %s)", default_factory=dict
+    )
     def _get_policy_version(self, policy_arn: str, version_id: str) -> Dict[str, Any]:
         """Get the specified version of an IAM policy"""
-        try:
-            return self.client.get_policy_version(
-                PolicyArn=policy_arn,
-                VersionId=version_id
-            )["PolicyVersion"]
-        except Exception as e:
-            logger.error(f"Error getting policy version for {policy_arn}: {e}")
-            return {}
+        return _fetch_policy_version(self.client, policy_arn, version_id)
 
     def _get_policy_tags(self, policy_arn: str) -> List[Dict[str, str]]:
         """Get tags for an IAM policy"""
-        try:
-            return self.client.list_policy_tags(PolicyArn=policy_arn)["Tags"]
-        except Exception:
+        if not self.include_tags:
             return []
+        tags_by_arn = self.get_tags_by_arn(
+            ["iam:policy"], region_name=GLOBAL_SERVICE_REGION
+        )
+        if tags_by_arn is not None:
+            return tags_by_arn.get(policy_arn, [])
+        return self._fetch_policy_tags(policy_arn)
+
+    @safe_collect("Error collecting tags for policy %s", default_factory=list)
+    def _fetch_policy_tags(self, policy_arn: str) -> List[Dict[str, str]]:
+        """Get the tags of an IAM policy with ListPolicyTags"""
+        return self.client.list_policy_tags(PolicyArn=policy_arn)["Tags"]
@@ -1,13 +1,70 @@
-from typing import Dict, List, Any
-from ..base import ResourceCollector, register_collector
+from typing import Dict, List, Any, Callable, Iterator, Optional, TypedDict
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+from ..base import (
+    ResourceCollector,
+    register_collector,
+    TagCache,
+    GLOBAL_SERVICE_REGION,
+    IAM_PAGINATION_CONFIG,
+    safe_collect,
+)
+from .authorization_details import iter_authorization_details
 
+import itertools
 import logging
-import traceback
+
 logger = logging.getLogger(__name__)
 
+# Name prefixes of AWS-managed roles that are never migrated
+_EXCLUDED_PREFIXES = (
+    "AWSServiceRole",
+    "aws-service-role",
+    "OrganizationAccountAccessRole",
+)
+
+
+class IAMRoleRecord(TypedDict):
+    """Record collected for an aws_iam_role"""
+
+    type: str
+    id: str
+    arn: str
+    tags: List[Dict[str, str]]
+    details: Dict[str, Any]
+
+
+class IAMRolePolicyRecord(TypedDict):
+    """Record collected for an aws_iam_role_policy"""
+
+    type: str
+    id: str
+    role_name: str
+    policy_name: str
+
+
+class IAMRolePolicyAttachmentRecord(TypedDict):
+    """Record collected for an aws_iam_role_policy_attachment"""
+
+    type: str
+    id: str
+    role_name: str
+    policy_arn: str
+
 
 @register_collector
 class IAMRoleCollector(ResourceCollector):
+    def __init__(
+        self,
+        session: boto3.Session = None,
+        progress_callback: Optional[Callable] = None,
+        include_tags: bool = True,
+        tag_cache: Optional[TagCache] = None,
+    ):
+        super().__init__(session, progress_callback, include_tags, tag_cache)
+        self._roles_cache = None
+        self._role_details_loaded = False
+
     @classmethod
     def get_service_name(self) -> str:
         return "iam"
@@ -22,130 +79,202 @@ class IAMRoleCollector(ResourceCollector):
 
     def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
+        self._roles_cache = None
+        collectors = {
+            "aws_iam_role": self._collect_roles,
+            "aws_iam_role_policy": self._collect_role_policies,
+            "aws_iam_role_policy_attachment": self._collect_role_policy_attachments,
+        }
+        if target_resource_type:
+            collectors = {
+                resource_type: collect_fn
+                for resource_type, collect_fn in collectors.items()
+                if resource_type == target_resource_type
+            }
         try:
-            if target_resource_type:
-                if target_resource_type == "aws_iam_role":
-                    resources.extend(self._collect_roles())
-                elif target_resource_type == "aws_iam_role_policy":
-                    resources.extend(self._collect_role_policies())
-                elif target_resource_type == "aws_iam_role_policy_attachment":
-                    resources.extend(self._collect_role_policy_attachments())
-            else:
-                resources.extend(self._collect_roles())
-                resources.extend(self._collect_role_policies())
-                resources.extend(self._collect_role_policy_attachments())
-        except Exception as e:
-            print(f"Error collecting IAM resources: {traceback.format_exc()}")
+            # Records stream from each generator straight into the result list
+            resources.extend(
+                itertools.chain.from_iterable(
+                    collect_fn() for collect_fn in collectors.values()
+                )
+            )
+        except Exception:
+            logger.exception("Error collecting IAM resources")
 
         return resources
 
-    def _collect_roles(self) -> List[Dict[str, Any]]:
-        resources = []
-        paginator = self.client.get_paginator("list_roles")
-        for page in paginator.paginate():
-            for role in page["Roles"]:
-                if not any(
-                    rule(role["RoleName"]) for rule in self.get_excluded_rules()
-                ):
-                    try:
-                        tags = self.client.list_role_tags(RoleName=role["RoleName"])[
-                            "Tags"
-                        ]
-                        resource_id = role["RoleName"]
-                        resources.append(
-                            {
-                                "type": "aws_iam_role",
-                                "id": resource_id,
-                                "arn": role["Arn"],
-                                "tags": tags,
-                                "details": {
-                                    "path": role.get("Path"),
-                                    "assume_role_policy": role.get(
-                                        "AssumeRolePolicyDocument", {}
-                                    ),
-                                },
-                            }
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error collecting details for role {role['RoleName']}: {str(e)}"
-                        )
-        return resources
+    def _collect_roles(self) -> Iterator[IAMRoleRecord]:
+        roles = self._list_roles_cached()
+        if self._role_details_loaded:
+            tag_lists = [role.get("Tags", []) for role in roles]
+        else:
+            tags_by_arn = (
+                self.get_tags_by_arn(["iam:role"], region_name=GLOBAL_SERVICE_REGION)
+                if self.include_tags
+                else {}
+            )
+            if tags_by_arn is not None:
+                tag_lists = [tags_by_arn.get(role["Arn"], []) for role in roles]
+            else:
+                tag_lists = self.parallel_map(
+                    self._fetch_role_tags, [role["RoleName"] for role in roles]
+                )
 
-    def _collect_role_policies(self) -> List[Dict[str, Any]]:
-        resources = []
-        role_paginator = self.client.get_paginator("list_roles")
-        for role_page in role_paginator.paginate():
-            for role in role_page["Roles"]:
-                if not any(
-                    rule(role["RoleName"]) for rule in self.get_excluded_rules()
-                ):
-                    try:
-                        policy_paginator = self.client.get_paginator(
-                            "list_role_policies"
-                        )
-                        for policy_page in policy_paginator.paginate(
-                            RoleName=role["RoleName"]
-                        ):
-                            for policy_name in policy_page["PolicyNames"]:
-                                resource_id = f"{role['RoleName']}_{policy_name}"
-                                resources.append(
-                                    {
-                                        "type": "aws_iam_role_policy",
-                                        "id": resource_id,
-                                        "role_name": role["RoleName"],
-                                        "policy_name": policy_name,
-                                    }
-                                )
-                    except Exception as e:
-                        logger.error(
-                            f"Error collecting inline policies for role {role['RoleName']}: {str(e)}"
-                        )
-        return resources
+        for role, tags in zip(roles, tag_lists):
+            if tags is None:
+                continue
+
+            yield {
+                "type": "aws_iam_role",
+                "id": role["RoleName"],
+                "arn": role["Arn"],
+                "tags": tags,
+                "details": {
+                    "path": role.get("Path"),
+                    "assume_role_policy": role.get("AssumeRolePolicyDocument", {}),
+                },
+            }
 
-    def _collect_role_policy_attachments(self) -> List[Dict[str, Any]]:
+    def _collect_role_policies(self) -> Iterator[IAMRolePolicyRecord]:
+        roles = self._list_roles_cached()
+        role_names = [role["RoleName"] for role in roles]
+        if self._role_details_loaded:
+            policy_name_lists = [
+                [policy["PolicyName"] for policy in role.get("RolePolicyList", [])]
+                for role in roles
+            ]
+        else:
+            policy_paginator = self.get_paginator("list_role_policies")
+            policy_name_lists = self.parallel_map(
+                lambda role_name: self._fetch_role_policy_names(
+                    role_name, paginator=policy_paginator
+                ),
+                role_names,
+            )
+
+        for role_name, policy_names in zip(role_names, policy_name_lists):
+            if policy_names is None:
+                continue
+
+            for policy_name in policy_names:
+                yield {
+                    "type": "aws_iam_role_policy",
+                    "id": "_".join((role_name, policy_name)),
+                    "role_name": role_name,
+                    "policy_name": policy_name,
+                }
+
+    def _collect_role_policy_attachments(
+        self,
+    ) -> Iterator[IAMRolePolicyAttachmentRecord]:
         """Collect role policy attachments"""
-        resources = []
-        role_paginator = self.client.get_paginator("list_roles")
-        role_names: List = []
-        for role_page in role_paginator.paginate():
-            for role in role_page["Roles"]:
-                role_names.append(role["RoleName"])
-
-        logger.debug(f"Collecting policy attachments for {len(role_names)} roles")
-        # Use STS client to get account ID
-        sts_client = self.session.client('sts')
-        account_id = sts_client.get_caller_identity()["Account"]
-        
-        for role_name in role_names:
-                if not any(
-                    rule(role_name) for rule in self.get_excluded_rules()
-                ):
-                    try:
-                        logger.debug(f"Getting attached policies for role: {role_name}")
-                        paginator = self.client.get_paginator("list_attached_role_policies")
-                        for page in paginator.paginate(RoleName=role_name):
-                            for policy in page["AttachedPolicies"]:
-                                attachment = {
-                                    "type": "aws_iam_role_policy_attachment",
-                                    "id": f"arn:aws:iam::{account_id}:role/{role_name}/{policy['PolicyArn']}",
-                                    "role_name": role_name,
-                                    "policy_arn": policy["PolicyArn"],
-                                }
-                                resources.append(attachment)
-                                logger.debug(f"Found policy attachment: {attachment['id']}")
-                    except Exception as e:
-                        logger.error(
-                            f"Error collecting policy attachments for role {role_name}: {str(e)}"
-                        )
-
-        logger.debug(f"Collected total of {len(resources)} policy attachments")
-        return resources
+        attachment_count = 0
+        roles = self._list_roles_cached()
+        role_names = [role["RoleName"] for role in roles]
 
-    def get_excluded_rules(self) -> List[callable]:
-        """Rules for excluding AWS-managed roles"""
+        logger.debug("Collecting policy attachments for %s roles", len(role_names))
+        account_id = self.account_id
+        if self._role_details_loaded:
+            attached_policy_lists = [
+                role.get("AttachedManagedPolicies", []) for role in roles
+            ]
+        else:
+            attachment_paginator = self.get_paginator(
+                "list_attached_role_policies"
+            )
+            attached_policy_lists = self.parallel_map(
+                lambda role_name: self._fetch_attached_role_policies(
+                    role_name, paginator=attachment_paginator
+                ),
+                role_names,
+            )
+
+        for role_name, attached_policies in zip(role_names, attached_policy_lists):
+            if attached_policies is None:
+                continue
+
+            # Every attachment id for this role shares the role ARN prefix
+            id_prefix = f"arn:aws:iam::{account_id}:role/{role_name}/"
+            for policy in attached_policies:
+                attachment = {
+                    "type": "aws_iam_role_policy_attachment",
+                    "id": id_prefix + policy["PolicyArn"],
+                    "role_name": role_name,
+                    "policy_arn": policy["PolicyArn"],
+                }
+                attachment_count += 1
+                logger.debug("Found policy attachment: %s", attachment["id"])
+                yield attachment
+
+        logger.debug("Collected total of %s policy attachments", attachment_count)
+
+    def _list_roles_cached(self) -> List[Dict[str, Any]]:
+        """
+        List roles not matching the excluded rules, fetched once per collection.
+
+        Roles are read from account authorization details, which also carry
+        their tags, inline policies and attached policies. If that call is not
+        permitted, list_roles is used and the other passes fall back to
+        per-role calls.
+        """
+        if self._roles_cache is None:
+            try:
+                roles = list(
+                    iter_authorization_details(self.client, "Role", "RoleDetailList")
+                )
+                self._role_details_loaded = True
+            except (BotoCoreError, ClientError) as e:
+                logger.warning(
+                    "Account authorization details unavailable, using per-role calls: %s",
+                    e,
+                )
+                roles = [
+                    role
+                    for page in self.get_paginator("list_roles").paginate(
+                        PaginationConfig=IAM_PAGINATION_CONFIG
+                    )
+                    for role in page["Roles"]
+                ]
+                self._role_details_loaded = False
+            self._roles_cache = [
+                role
+                for role in roles
+                if not role["RoleName"].startswith(_EXCLUDED_PREFIXES)
+            ]
+        return self._roles_cache
+
+    @safe_collect("Error collecting details for role %s")
+    def _fetch_role_tags(self, role_name: str) -> Optional[List[Dict[str, str]]]:
+        """Get the tags of a role, or None on failure"""
+        return self.client.list_role_tags(RoleName=role_name)["Tags"]
+
+    @safe_collect("Error collecting inline policies for role %s")
+    def _fetch_role_policy_names(
+        self, role_name: str, paginator
+    ) -> Optional[List[str]]:
+        """Get the inline policy names of a role, or None on failure"""
+        return [
+            policy_name
+            for page in paginator.paginate(
+                RoleName=role_name, PaginationConfig=IAM_PAGINATION_CONFIG
+            )
+            for policy_name in page["PolicyNames"]
+        ]
+
+    @safe_collect("Error collecting policy attachments for role %s")
+    def _fetch_attached_role_policies(
+        self, role_name: str, paginator
+    ) -> Optional[List[Dict[str, str]]]:
+        """Get the managed policies attached to a role, or None on failure"""
+        logger.debug("Getting attached policies for role: %s", role_name)
         return [
-            lambda x: x.startswith("AWSServiceRole"),
-            lambda x: x.startswith("aws-service-role"),
-            lambda x: x.startswith("OrganizationAccountAccessRole"),
+            policy
+            for page in paginator.paginate(
+                RoleName=role_name, PaginationConfig=IAM_PAGINATION_CONFIG
+            )
+            for policy in page["AttachedPolicies"]
         ]
+
+    def get_excluded_rules(self) -> List[callable]:
+        """Rules for excluding AWS-managed roles"""
+        return [lambda x: x.startswith(_EXCLUDED_PREFIXES)]
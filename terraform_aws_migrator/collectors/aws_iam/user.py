@@ -1,13 +1,81 @@
 
-from typing import Dict, List, Any
-from ..base import ResourceCollector, register_collector
+from typing import Dict, List, Any, Callable, Iterator, Optional, Pattern, TypedDict
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+from ..base import (
+    ResourceCollector,
+    register_collector,
+    TagCache,
+    GLOBAL_SERVICE_REGION,
+    IAM_PAGINATION_CONFIG,
+    safe_collect,
+)
+from .authorization_details import iter_authorization_details
 
+import itertools
 import logging
+import os
+import re
 
 logger = logging.getLogger(__name__)
 
+# Environment variable holding an optional regular expression selecting IAM
+# users by name. Users that do not match are skipped before any per-user API
+# call.
+USER_NAME_FILTER_ENV = "TF_AWS_MIGRATOR_IAM_USER_FILTER"
+
+
+class IAMUserRecord(TypedDict):
+    """Record collected for an aws_iam_user"""
+
+    type: str
+    id: str
+    arn: str
+    tags: List[Dict[str, str]]
+
+
+class _IAMUserPolicyRecordBase(TypedDict):
+    type: str
+    id: str
+    user_name: str
+    policy_name: str
+
+
+class IAMUserPolicyRecord(_IAMUserPolicyRecordBase, total=False):
+    """Record collected for an aws_iam_user_policy"""
+
+    # Only present when read from account authorization details; the per-user
+    # fallback lists policy names without a GetUserPolicy call per policy
+    policy_document: Dict[str, Any]
+
+
+class IAMUserPolicyAttachmentRecord(TypedDict):
+    """Record collected for an aws_iam_user_policy_attachment"""
+
+    type: str
+    id: str
+    user_name: str
+    policy_arn: str
+
+
 @register_collector
 class IAMUserCollector(ResourceCollector):
+    def __init__(
+        self,
+        session: boto3.Session = None,
+        progress_callback: Optional[Callable] = None,
+        include_tags: bool = True,
+        tag_cache: Optional[TagCache] = None,
+    ):
+        super().__init__(session, progress_callback, include_tags, tag_cache)
+        self._user_details_cache = None
+        self._user_details_loaded = False
+        self._users_cache = None
+        # Cleared on AccessDenied so later collections skip straight to the
+        # per-user calls
+        self._has_authdetails_perm = True
+        self._user_name_filter = self._load_user_name_filter()
+
     @classmethod
     def get_service_name(self) -> str:
         return "iam"
@@ -22,122 +90,266 @@ class IAMUserCollector(ResourceCollector):
 
     def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
+        self._user_details_loaded = False
+        self._users_cache = None
+        collectors = {
+            "aws_iam_user": self._collect_users,
+            "aws_iam_user_policy": self._collect_user_policies,
+            "aws_iam_user_policy_attachment": self._collect_user_policy_attachments,
+        }
+        if target_resource_type:
+            collectors = {
+                resource_type: collect_fn
+                for resource_type, collect_fn in collectors.items()
+                if resource_type == target_resource_type
+            }
         try:
-            if target_resource_type:
-                if target_resource_type == "aws_iam_user":
-                    resources.extend(self._collect_users())
-                elif target_resource_type == "aws_iam_user_policy":
-                    resources.extend(self._collect_user_policies())
-                elif target_resource_type == "aws_iam_user_policy_attachment":
-                    resources.extend(self._collect_user_policy_attachments())
-            else:
-                resources.extend(self._collect_users())
-                resources.extend(self._collect_user_policies())
-                resources.extend(self._collect_user_policy_attachments())
-        except Exception as e:
-            print(f"Error collecting IAM resources: {str(e)}")
+            # Records stream from each generator straight into the result list
+            resources.extend(
+                itertools.chain.from_iterable(
+                    collect_fn() for collect_fn in collectors.values()
+                )
+            )
+        except Exception:
+            logger.exception("Error collecting IAM resources")
 
         return resources
 
-    def _collect_users(self) -> List[Dict[str, Any]]:
-        """Collect IAM users"""
-        resources = []
-        paginator = self.client.get_paginator("list_users")
-        for page in paginator.paginate():
-            for user in page["Users"]:
-                try:
-                    tags = self.client.list_user_tags(UserName=user["UserName"])["Tags"]
-                    resources.append(
-                        {
-                            "type": "user",
-                            "id": user["UserName"],
-                            "arn": user["Arn"],
-                            "tags": tags,
-                        }
-                    )
-                except Exception as e:
-                    print(
-                        f"Error collecting tags for user {user['UserName']}: {str(e)}"
-                    )
-        return resources
+    def _load_user_details(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get users from account authorization details, fetched once per collection.
 
-    def _collect_user_policies(self) -> List[Dict[str, Any]]:
-        """Collect inline user policies"""
-        resources = []
-        user_paginator = self.client.get_paginator("list_users")
-        for user_page in user_paginator.paginate():
-            for user in user_page["Users"]:
-                try:
-                    policy_paginator = self.client.get_paginator("list_user_policies")
-                    for policy_page in policy_paginator.paginate(
-                        UserName=user["UserName"]
-                    ):
-                        for policy_name in policy_page["PolicyNames"]:
-                            resources.append(
-                                {
-                                    "type": "user_policy",
-                                    "id": f"{user['UserName']}:{policy_name}",
-                                    "user_name": user["UserName"],
-                                    "policy_name": policy_name,
-                                }
-                            )
-                except Exception as e:
-                    print(
-                        f"Error collecting inline policies for user {user['UserName']}: {str(e)}"
+        Each entry carries the user's tags, inline policies and attached
+        policies. Returns None if the call is not permitted, in which case the
+        per-user IAM calls are used instead.
+        """
+        if not self._has_authdetails_perm:
+            return None
+        if not self._user_details_loaded:
+            try:
+                self._user_details_cache = [
+                    user
+                    for user in iter_authorization_details(
+                        self.client, "User", "UserDetailList"
                     )
-        return resources
+                    if self._is_selected(user)
+                ]
+            except (BotoCoreError, ClientError) as e:
+                if (
+                    isinstance(e, ClientError)
+                    and e.response["Error"]["Code"] == "AccessDenied"
+                ):
+                    self._has_authdetails_perm = False
+                logger.warning(
+                    "Account authorization details unavailable, using per-user calls: %s",
+                    e,
+                )
+                self._user_details_cache = None
+            self._user_details_loaded = True
+        return self._user_details_cache
 
-    def _collect_user_policies(self) -> List[Dict[str, Any]]:
+    def _iter_users(self) -> List[Dict[str, Any]]:
+        """
+        Get IAM users from list_users, paginated once per collection.
+
+        Shared by the per-user fallbacks so a full scan lists users once
+        rather than once per resource type.
+        """
+        if self._users_cache is None:
+            paginator = self.get_paginator("list_users")
+            self._users_cache = [
+                user
+                for page in paginator.paginate(PaginationConfig=IAM_PAGINATION_CONFIG)
+                for user in page["Users"]
+                if self._is_selected(user)
+            ]
+        return self._users_cache
+
+    @staticmethod
+    def _load_user_name_filter() -> Optional[Pattern[str]]:
+        """Compile the user name filter, ignoring an invalid pattern"""
+        pattern = os.environ.get(USER_NAME_FILTER_ENV)
+        if not pattern:
+            return None
+        try:
+            return re.compile(pattern)
+        except re.error as e:
+            logger.warning(
+                "Ignoring invalid %s pattern %r: %s", USER_NAME_FILTER_ENV, pattern, e
+            )
+            return None
+
+    def _is_selected(self, user: Dict[str, Any]) -> bool:
+        """Check a user against TF_AWS_MIGRATOR_IAM_USER_FILTER, if set"""
+        return (
+            self._user_name_filter is None
+            or self._user_name_filter.search(user["UserName"]) is not None
+        )
+
+    def _collect_users(self) -> Iterator[IAMUserRecord]:
+        """Collect IAM users"""
+        user_details = self._load_user_details()
+        if user_details is None:
+            yield from self._collect_users_per_user()
+            return
+
+        for user in user_details:
+            yield {
+                "type": "aws_iam_user",
+                "id": user["UserName"],
+                "arn": user["Arn"],
+                "tags": user.get("Tags", []),
+            }
+
+    def _collect_user_policies(self) -> Iterator[IAMUserPolicyRecord]:
         """Collect inline user policies"""
-        resources = []
-        user_paginator = self.client.get_paginator("list_users")
-        for user_page in user_paginator.paginate():
-            for user in user_page["Users"]:
-                try:
-                    policy_paginator = self.client.get_paginator("list_user_policies")
-                    for policy_page in policy_paginator.paginate(
-                        UserName=user["UserName"]
-                    ):
-                        for policy_name in policy_page["PolicyNames"]:
-                            resources.append(
-                                {
-                                    "type": "user_policy",
-                                    "id": f"{user['UserName']}:{policy_name}",
-                                    "user_name": user["UserName"],
-                                    "policy_name": policy_name,
-                                }
-                            )
-                except Exception as e:
-                    print(
-                        f"Error collecting inline policies for user {user['UserName']}: {str(e)}"
-                    )
-        return resources
+        user_details = self._load_user_details()
+        if user_details is None:
+            yield from self._collect_user_policies_per_user()
+            return
 
+        for user in user_details:
+            user_name = user["UserName"]
+            id_prefix = user_name + ":"
+            for policy in user.get("UserPolicyList", []):
+                yield {
+                    "type": "aws_iam_user_policy",
+                    "id": id_prefix + policy["PolicyName"],
+                    "user_name": user_name,
+                    "policy_name": policy["PolicyName"],
+                    "policy_document": policy["PolicyDocument"],
+                }
 
-    def _collect_user_policy_attachments(self) -> List[Dict[str, Any]]:
+    def _collect_user_policy_attachments(
+        self,
+    ) -> Iterator[IAMUserPolicyAttachmentRecord]:
         """Collect user policy attachments"""
-        resources = []
-        user_paginator = self.client.get_paginator("list_users")
-        for user_page in user_paginator.paginate():
-            for user in user_page["Users"]:
-                try:
-                    attachment_paginator = self.client.get_paginator(
-                        "list_attached_user_policies"
-                    )
-                    for attachment_page in attachment_paginator.paginate(
-                        UserName=user["UserName"]
-                    ):
-                        for policy in attachment_page["AttachedPolicies"]:
-                            resources.append(
-                                {
-                                    "type": "user_policy_attachment",
-                                    "id": f"{user['UserName']}:{policy['PolicyName']}",
-                                    "user_name": user["UserName"],
-                                    "policy_arn": policy["PolicyArn"],
-                                }
-                            )
-                except Exception as e:
-                    print(
-                        f"Error collecting policy attachments for user {user['UserName']}: {str(e)}"
-                    )
-        return resources
+        user_details = self._load_user_details()
+        if user_details is None:
+            yield from self._collect_user_policy_attachments_per_user()
+            return
+
+        for user in user_details:
+            user_name = user["UserName"]
+            id_prefix = user_name + ":"
+            for policy in user.get("AttachedManagedPolicies", []):
+                yield {
+                    "type": "aws_iam_user_policy_attachment",
+                    "id": id_prefix + policy["PolicyName"],
+                    "user_name": user_name,
+                    "policy_arn": policy["PolicyArn"],
+                }
+
+    def _collect_users_per_user(self) -> Iterator[IAMUserRecord]:
+        """Collect IAM users with per-user tag calls"""
+        users = self._iter_users()
+        tags_by_arn = (
+            self.get_tags_by_arn(["iam:user"], region_name=GLOBAL_SERVICE_REGION)
+            if self.include_tags
+            else {}
+        )
+        if tags_by_arn is not None:
+            tag_lists = [tags_by_arn.get(user["Arn"], []) for user in users]
+        else:
+            # Only call list_user_tags for users that list_users returned
+            # without their tags
+            untagged = [user["UserName"] for user in users if "Tags" not in user]
+            fetched_tags = dict(
+                zip(untagged, self.parallel_map(self._fetch_user_tags, untagged))
+            )
+            tag_lists = [
+                user["Tags"] if "Tags" in user else fetched_tags[user["UserName"]]
+                for user in users
+            ]
+
+        for user, tags in zip(users, tag_lists):
+            if tags is None:
+                continue
+
+            yield {
+                "type": "aws_iam_user",
+                "id": user["UserName"],
+                "arn": user["Arn"],
+                "tags": tags,
+            }
+
+    def _collect_user_policies_per_user(self) -> Iterator[IAMUserPolicyRecord]:
+        """Collect inline user policies with per-user IAM calls"""
+        user_names = [user["UserName"] for user in self._iter_users()]
+        policy_paginator = self.get_paginator("list_user_policies")
+        policy_name_lists = self.parallel_map(
+            lambda user_name: self._fetch_user_policy_names(
+                user_name, paginator=policy_paginator
+            ),
+            user_names,
+        )
+
+        for user_name, policy_names in zip(user_names, policy_name_lists):
+            if policy_names is None:
+                continue
+
+            id_prefix = user_name + ":"
+            for policy_name in policy_names:
+                yield {
+                    "type": "aws_iam_user_policy",
+                    "id": id_prefix + policy_name,
+                    "user_name": user_name,
+                    "policy_name": policy_name,
+                }
+
+    def _collect_user_policy_attachments_per_user(
+        self,
+    ) -> Iterator[IAMUserPolicyAttachmentRecord]:
+        """Collect user policy attachments with per-user IAM calls"""
+        user_names = [user["UserName"] for user in self._iter_users()]
+        attachment_paginator = self.get_paginator("list_attached_user_policies")
+        attached_policy_lists = self.parallel_map(
+            lambda user_name: self._fetch_attached_user_policies(
+                user_name, paginator=attachment_paginator
+            ),
+            user_names,
+        )
+
+        for user_name, attached_policies in zip(user_names, attached_policy_lists):
+            if attached_policies is None:
+                continue
+
+            id_prefix = user_name + ":"
+            for policy in attached_policies:
+                yield {
+                    "type": "aws_iam_user_policy_attachment",
+                    "id": id_prefix + policy["PolicyName"],
+                    "user_name": user_name,
+                    "policy_arn": policy["PolicyArn"],
+                }
+
+    @safe_collect("Error collecting tags for user %s")
+    def _fetch_user_tags(self, user_name: str) -> Optional[List[Dict[str, str]]]:
+        """Get the tags of a user, or None on failure"""
+        return self.client.list_user_tags(UserName=user_name)["Tags"]
+
+    @safe_collect("Error collecting inline policies for user %s")
+    def _fetch_user_policy_names(
+        self, user_name: str, paginator
+    ) -> Optional[List[str]]:
+        """Get the inline policy names of a user, or None on failure"""
+        return [
+            policy_name
+            for page in paginator.paginate(
+                UserName=user_name, PaginationConfig=IAM_PAGINATION_CONFIG
+            )
+            for policy_name in page["PolicyNames"]
+        ]
+
+    @safe_collect("Error collecting policy attachments for user %s")
+    def _fetch_attached_user_policies(
+        self, user_name: str, paginator
+    ) -> Optional[List[Dict[str, str]]]:
+        """Get the managed policies attached to a user, or None on failure"""
+        return [
+            policy
+            for page in paginator.paginate(
+                UserName=user_name, PaginationConfig=IAM_PAGINATION_CONFIG
+            )
+            for policy in page["AttachedPolicies"]
+        ]
@@ -1,7 +1,64 @@
 # terraform_aws_migrator/collectors/aws_networking.py
 
-from typing import Dict, List, Any
-from .base import ResourceCollector, register_collector
+from typing import Dict, List, Any, Callable, Iterator, Optional, Sequence, Tuple
+import itertools
+import threading
+import boto3
+from .base import (
+    ResourceCollector,
+    register_collector,
+    TagCache,
+    chunked,
+    safe_collect,
+    GLOBAL_SERVICE_REGION,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Largest number of resources accepted by one ELB/ELBv2 DescribeTags call
+DESCRIBE_TAGS_BATCH_SIZE = 20
+
+# Largest number of hosted zones accepted by one Route 53 ListTagsForResources call
+LIST_TAGS_FOR_RESOURCES_BATCH_SIZE = 10
+
+# Largest page size accepted by API Gateway GetRestApis (the default is 25)
+API_GATEWAY_PAGINATION_CONFIG = {"PageSize": 500}
+
+# Tagging API filters for ELB resources. The ELBv2 and classic ELB collectors
+# query the same filters so they share one tag index per audit run.
+ELB_TAG_FILTERS = (
+    "elasticloadbalancing:loadbalancer",
+    "elasticloadbalancing:targetgroup",
+    "elasticloadbalancing:listener",
+)
+
+# Tagging API filters for ALB listener rules, only queried when listener rules
+# are collected as resources of their own
+ELB_RULE_TAG_FILTERS = ("elasticloadbalancing:listener-rule",)
+
+# Largest page size accepted by ELB/ELBv2 describe operations (the default is
+# far smaller, costing extra round trips on accounts with many resources)
+ELB_PAGINATION_CONFIG = {"PageSize": 400}
+
+# ALB/NLB settings copied as-is, as record field -> DescribeLoadBalancers key
+_LB_DETAIL_FIELDS = {
+    "dns_name": "DNSName",
+    "scheme": "Scheme",
+    "vpc_id": "VpcId",
+    "ip_address_type": "IpAddressType",
+}
+
+# Target group health check settings, as record field -> DescribeTargetGroups key
+_TG_HEALTH_CHECK_FIELDS = {
+    "protocol": "HealthCheckProtocol",
+    "port": "HealthCheckPort",
+    "path": "HealthCheckPath",
+    "interval": "HealthCheckIntervalSeconds",
+    "timeout": "HealthCheckTimeoutSeconds",
+    "healthy_threshold": "HealthyThresholdCount",
+    "unhealthy_threshold": "UnhealthyThresholdCount",
+}
 
 
 @register_collector
@@ -19,19 +76,26 @@ class APIGatewayCollector(ResourceCollector):
 
         try:
             # REST APIs
-            apis = self.client.get_rest_apis()["items"]
-            for api in apis:
-                resources.append(
-                    {
-                        "type": "aws_api_gateway_rest_api",
-                        "id": api["id"],
-                        "name": api["name"],
-                        "arn": f"arn:aws:apigateway:{self.session.region_name}::/restapis/{api['id']}",
-                        "tags": api.get("tags", {}),
-                    }
+            paginator = self.get_paginator("get_rest_apis")
+            apis = [
+                api
+                for page in paginator.paginate(
+                    PaginationConfig=API_GATEWAY_PAGINATION_CONFIG
                 )
-        except Exception as e:
-            print(f"Error collecting API Gateway resources: {str(e)}")
+                for api in page.get("items", [])
+            ]
+            resources = [
+                {
+                    "type": "aws_api_gateway_rest_api",
+                    "id": api["id"],
+                    "name": api["name"],
+                    "arn": f"arn:aws:apigateway:{self.region}::/restapis/{api['id']}",
+                    "tags": api.get("tags", {}),
+                }
+                for api in apis
+            ]
+        except Exception:
+            logger.exception("Error collecting API Gateway resources")
 
         return resources
 
@@ -46,24 +110,25 @@ class APIGatewayV2Collector(ResourceCollector):
     def get_resource_types(self) -> Dict[str, str]:
         return {"aws_apigatewayv2_api": "API Gateway HTTP/WebSocket APIs"}
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
             # HTTP and WebSocket APIs
-            apis = self.client.get_apis()["Items"]
-            for api in apis:
-                resources.append(
-                    {
-                        "type": "aws_apigatewayv2_api",
-                        "id": api["ApiId"],
-                        "name": api["Name"],
-                        "arn": f"arn:aws:apigateway:{self.session.region_name}::/apis/{api['ApiId']}",
-                        "tags": api.get("Tags", {}),
-                    }
-                )
-        except Exception as e:
-            print(f"Error collecting API Gateway V2 resources: {str(e)}")
+            paginator = self.get_paginator("get_apis")
+            apis = [api for page in paginator.paginate() for api in page["Items"]]
+            resources = [
+                {
+                    "type": "aws_apigatewayv2_api",
+                    "id": api["ApiId"],
+                    "name": api["Name"],
+                    "arn": f"arn:aws:apigateway:{self.region}::/apis/{api['ApiId']}",
+                    "tags": api.get("Tags", {}),
+                }
+                for api in apis
+            ]
+        except Exception:
+            logger.exception("Error collecting API Gateway V2 resources")
 
         return resources
 
@@ -78,32 +143,64 @@ class Route53Collector(ResourceCollector):
     def get_resource_types(self) -> Dict[str, str]:
         return {"aws_route53_zone": "Route 53 Hosted Zones"}
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
+            tags_by_arn = (
+                self.get_tags_by_arn(
+                    ["route53:hostedzone"], region_name=GLOBAL_SERVICE_REGION
+                )
+                if self.include_tags
+                else {}
+            )
+
             # Hosted zones
-            paginator = self.client.get_paginator("list_hosted_zones")
-            for page in paginator.paginate():
-                for zone in page["HostedZones"]:
-                    tags = self.client.list_tags_for_resource(
-                        ResourceType="hostedzone",
-                        ResourceId=zone["Id"].replace("/hostedzone/", ""),
-                    )["ResourceTagSet"]["Tags"]
-
-                    resources.append(
-                        {
-                            "type": "aws_route53_zone",
-                            "id": zone["Id"],
-                            "name": zone["Name"],
-                            "tags": tags,
-                        }
+            paginator = self.get_paginator("list_hosted_zones")
+            zones = [
+                zone for page in paginator.paginate() for zone in page["HostedZones"]
+            ]
+            zone_ids = [zone["Id"].replace("/hostedzone/", "") for zone in zones]
+            if tags_by_arn is None:
+                tags_by_id = {}
+                for batch_tags in self.parallel_map(
+                    self._fetch_tags,
+                    chunked(zone_ids, LIST_TAGS_FOR_RESOURCES_BATCH_SIZE),
+                ):
+                    tags_by_id.update(batch_tags)
+            else:
+                tags_by_id = {
+                    zone_id: tags_by_arn.get(
+                        f"arn:aws:route53:::hostedzone/{zone_id}", []
                     )
-        except Exception as e:
-            print(f"Error collecting Route53 resources: {str(e)}")
+                    for zone_id in zone_ids
+                }
+
+            resources = [
+                {
+                    "type": "aws_route53_zone",
+                    "id": zone["Id"],
+                    "name": zone["Name"],
+                    "tags": tags_by_id.get(zone_id, []),
+                }
+                for zone, zone_id in zip(zones, zone_ids)
+            ]
+        except Exception:
+            logger.exception("Error collecting Route53 resources")
 
         return resources
 
+    @safe_collect("Error collecting tags for hosted zones %s", default_factory=dict)
+    def _fetch_tags(self, zone_ids: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Get the tags of up to 10 hosted zones, keyed by zone id"""
+        response = self.client.list_tags_for_resources(
+            ResourceType="hostedzone", ResourceIds=zone_ids
+        )
+        return {
+            tag_set["ResourceId"]: self.tag_cache.intern(tag_set["Tags"])
+            for tag_set in response["ResourceTagSets"]
+        }
+
 
 @register_collector
 class CloudFrontCollector(ResourceCollector):
@@ -115,36 +212,67 @@ class CloudFrontCollector(ResourceCollector):
     def get_resource_types(self) -> Dict[str, str]:
         return {"aws_cloudfront_distribution": "CloudFront Distributions"}
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
-            paginator = self.client.get_paginator("list_distributions")
-            for page in paginator.paginate():
-                for dist in page["DistributionList"].get("Items", []):
-                    tags = self.client.list_tags_for_resource(Resource=dist["ARN"])[
-                        "Tags"
-                    ]["Items"]
-
-                    resources.append(
-                        {
-                            "type": "aws_cloudfront_distribution",
-                            "id": dist["Id"],
-                            "domain_name": dist["DomainName"],
-                            "arn": dist["ARN"],
-                            "tags": tags,
-                        }
-                    )
-        except Exception as e:
-            print(f"Error collecting CloudFront resources: {str(e)}")
+            tags_by_arn = (
+                self.get_tags_by_arn(
+                    ["cloudfront:distribution"], region_name=GLOBAL_SERVICE_REGION
+                )
+                if self.include_tags
+                else {}
+            )
+            paginator = self.get_paginator("list_distributions")
+            dists = [
+                dist
+                for page in paginator.paginate()
+                for dist in page["DistributionList"].get("Items", [])
+            ]
+            if tags_by_arn is not None:
+                tag_lists = [tags_by_arn.get(dist["ARN"], []) for dist in dists]
+            else:
+                tag_lists = self.parallel_map(
+                    self._fetch_tags, [dist["ARN"] for dist in dists]
+                )
+
+            resources = [
+                {
+                    "type": "aws_cloudfront_distribution",
+                    "id": dist["Id"],
+                    "domain_name": dist["DomainName"],
+                    "arn": dist["ARN"],
+                    "tags": tags,
+                }
+                for dist, tags in zip(dists, tag_lists)
+            ]
+        except Exception:
+            logger.exception("Error collecting CloudFront resources")
 
         return resources
 
+    @safe_collect("Error collecting tags for distribution %s", default_factory=list)
+    def _fetch_tags(self, distribution_arn: str) -> List[Dict[str, str]]:
+        """Get the tags of a distribution"""
+        response = self.client.list_tags_for_resource(Resource=distribution_arn)
+        return response["Tags"].get("Items", [])
+
 
 @register_collector
 class LoadBalancerV2Collector(ResourceCollector):
     """Collector for ALB/NLB and related resources (ELBv2)"""
 
+    def __init__(
+        self,
+        session: boto3.Session = None,
+        progress_callback: Optional[Callable] = None,
+        include_tags: bool = True,
+        tag_cache: Optional[TagCache] = None,
+    ):
+        super().__init__(session, progress_callback, include_tags, tag_cache)
+        self._load_balancers_cache = None
+        self._load_balancers_lock = threading.Lock()
+
     @classmethod
     def get_service_name(self) -> str:
         return "elbv2"
@@ -158,229 +286,284 @@ class LoadBalancerV2Collector(ResourceCollector):
             "aws_lb_listener_rule": "Routing rules for ALB listeners",
         }
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
+        self._load_balancers_cache = None
 
+        stages = {
+            "aws_lb": self._collect_load_balancers,
+            "aws_lb_target_group": self._collect_target_groups,
+            "aws_lb_listener": self._collect_listeners_and_rules,
+        }
+        if target_resource_type:
+            # Rules are reported inside their listener, and as resources of
+            # their own only when they are the target
+            stages["aws_lb_listener_rule"] = self._collect_listener_rules
+            stages = {
+                resource_type: stage
+                for resource_type, stage in stages.items()
+                if resource_type == target_resource_type
+            }
         try:
-            # Collect ALB/NLB
-            lb_resources = self._collect_load_balancers()
-            resources.extend(lb_resources)
-
-            # Collect Target Groups
-            tg_resources = self._collect_target_groups()
-            resources.extend(tg_resources)
-
-            # Collect Listeners and Rules
-            listener_resources = self._collect_listeners_and_rules()
-            resources.extend(listener_resources)
+            # The stages are independent (the load balancer list they share is
+            # fetched once under a lock), so they run concurrently
+            resources.extend(
+                itertools.chain.from_iterable(
+                    self.parallel_map(
+                        lambda stage: list(stage()), list(stages.values())
+                    )
+                )
+            )
 
             if self.progress_callback:
                 self.progress_callback("elbv2", "Completed", len(resources))
 
         except Exception as e:
+            logger.exception("Error collecting ELBv2 resources")
             if self.progress_callback:
                 self.progress_callback("elbv2", f"Error: {str(e)}", 0)
 
         return resources
 
-    def _collect_load_balancers(self) -> List[Dict[str, Any]]:
+    def _collect_load_balancers(self) -> Iterator[Dict[str, Any]]:
         """Collect ALB and NLB resources"""
-        resources = []
         try:
-            paginator = self.client.get_paginator("describe_load_balancers")
-            for page in paginator.paginate():
-                for lb in page["LoadBalancers"]:
-                    # Get tags
-                    try:
-                        tags_response = self.client.describe_tags(
-                            ResourceArns=[lb["LoadBalancerArn"]]
-                        )
-                        tags = (
-                            tags_response["TagDescriptions"][0]["Tags"]
-                            if tags_response["TagDescriptions"]
-                            else []
-                        )
-                    except Exception:
-                        tags = []
-
-                    resources.append(
-                        {
-                            "type": "aws_lb",
-                            "id": lb["LoadBalancerName"],
-                            "arn": lb["LoadBalancerArn"],
-                            "tags": tags,
-                            "details": {
-                                "type": lb["Type"],  # 'application' or 'network'
-                                "dns_name": lb.get("DNSName"),
-                                "scheme": lb.get("Scheme"),
-                                "vpc_id": lb.get("VpcId"),
-                                "security_groups": lb.get("SecurityGroups", []),
-                                "subnets": [
-                                    az["SubnetId"]
-                                    for az in lb.get("AvailabilityZones", [])
-                                ],
-                                "state": lb.get("State", {}).get("Code"),
-                                "ip_address_type": lb.get("IpAddressType"),
-                            },
-                        }
-                    )
-        except Exception as e:
-            print(f"Error collecting load balancers: {e}")
-        return resources
-
-    def _collect_target_groups(self) -> List[Dict[str, Any]]:
+            lbs = self._list_load_balancers()
+            tag_lists = self._get_tags([lb["LoadBalancerArn"] for lb in lbs])
+            for lb, tags in zip(lbs, tag_lists):
+                yield {
+                    "type": "aws_lb",
+                    "id": lb["LoadBalancerName"],
+                    "arn": lb["LoadBalancerArn"],
+                    "tags": tags,
+                    "details": {
+                        "type": lb["Type"],  # 'application' or 'network'
+                        **{
+                            field: lb.get(key)
+                            for field, key in _LB_DETAIL_FIELDS.items()
+                        },
+                        "security_groups": lb.get("SecurityGroups", []),
+                        "subnets": [
+                            az["SubnetId"] for az in lb.get("AvailabilityZones", [])
+                        ],
+                        "state": lb.get("State", {}).get("Code"),
+                    },
+                }
+        except Exception:
+            logger.exception("Error collecting load balancers")
+
+    def _collect_target_groups(self) -> Iterator[Dict[str, Any]]:
         """Collect Target Groups and their attachments"""
-        resources = []
         try:
-            paginator = self.client.get_paginator("describe_target_groups")
-            for page in paginator.paginate():
-                for tg in page["TargetGroups"]:
-                    # Get tags
-                    try:
-                        tags_response = self.client.describe_tags(
-                            ResourceArns=[tg["TargetGroupArn"]]
-                        )
-                        tags = (
-                            tags_response["TagDescriptions"][0]["Tags"]
-                            if tags_response["TagDescriptions"]
-                            else []
-                        )
-                    except Exception:
-                        tags = []
-
-                    # Get targets (attachments)
-                    try:
-                        targets_response = self.client.describe_target_health(
-                            TargetGroupArn=tg["TargetGroupArn"]
-                        )
-                        targets = targets_response.get("TargetHealthDescriptions", [])
-                    except Exception:
-                        targets = []
-
-                    resources.append(
-                        {
-                            "type": "aws_lb_target_group",
-                            "id": tg["TargetGroupName"],
-                            "arn": tg["TargetGroupArn"],
-                            "tags": tags,
-                            "details": {
-                                "protocol": tg.get("Protocol"),
-                                "port": tg.get("Port"),
-                                "vpc_id": tg.get("VpcId"),
-                                "target_type": tg.get("TargetType"),
-                                "health_check": {
-                                    "protocol": tg.get("HealthCheckProtocol"),
-                                    "port": tg.get("HealthCheckPort"),
-                                    "path": tg.get("HealthCheckPath"),
-                                    "interval": tg.get("HealthCheckIntervalSeconds"),
-                                    "timeout": tg.get("HealthCheckTimeoutSeconds"),
-                                    "healthy_threshold": tg.get(
-                                        "HealthyThresholdCount"
-                                    ),
-                                    "unhealthy_threshold": tg.get(
-                                        "UnhealthyThresholdCount"
-                                    ),
-                                },
-                                "targets": [
-                                    {
-                                        "id": target["Target"]["Id"],
-                                        "port": target["Target"].get("Port"),
-                                        "health": target.get("TargetHealth", {}).get(
-                                            "State"
-                                        ),
-                                    }
-                                    for target in targets
-                                ],
-                            },
-                        }
-                    )
-        except Exception as e:
-            print(f"Error collecting target groups: {e}")
-        return resources
-
-    def _collect_listeners_and_rules(self) -> List[Dict[str, Any]]:
+            paginator = self.get_paginator("describe_target_groups")
+            tgs = [
+                tg
+                for page in paginator.paginate(PaginationConfig=ELB_PAGINATION_CONFIG)
+                for tg in page["TargetGroups"]
+            ]
+            tg_arns = [tg["TargetGroupArn"] for tg in tgs]
+            tag_lists = self._get_tags(tg_arns)
+            # Get targets (attachments)
+            target_lists = self.parallel_map(self._fetch_target_health, tg_arns)
+            for tg, tags, targets in zip(tgs, tag_lists, target_lists):
+                yield {
+                    "type": "aws_lb_target_group",
+                    "id": tg["TargetGroupName"],
+                    "arn": tg["TargetGroupArn"],
+                    "tags": tags,
+                    "details": {
+                        "protocol": tg.get("Protocol"),
+                        "port": tg.get("Port"),
+                        "vpc_id": tg.get("VpcId"),
+                        "target_type": tg.get("TargetType"),
+                        "health_check": {
+                            field: tg.get(key)
+                            for field, key in _TG_HEALTH_CHECK_FIELDS.items()
+                        },
+                        "targets": [
+                            {
+                                "id": target["Target"]["Id"],
+                                "port": target["Target"].get("Port"),
+                                "health": target.get("TargetHealth", {}).get("State"),
+                            }
+                            for target in targets
+                        ],
+                    },
+                }
+        except Exception:
+            logger.exception("Error collecting target groups")
+
+    def _collect_listeners_and_rules(self) -> Iterator[Dict[str, Any]]:
         """Collect Listeners, Rules, and Certificates"""
-        resources = []
         try:
-            # First get all load balancers
-            paginator = self.client.get_paginator("describe_load_balancers")
-            for page in paginator.paginate():
-                for lb in page["LoadBalancers"]:
-                    # Get listeners for each load balancer
-                    try:
-                        listener_paginator = self.client.get_paginator(
-                            "describe_listeners"
-                        )
-                        for listener_page in listener_paginator.paginate(
-                            LoadBalancerArn=lb["LoadBalancerArn"]
-                        ):
-                            for listener in listener_page["Listeners"]:
-                                # Get tags
-                                try:
-                                    tags_response = self.client.describe_tags(
-                                        ResourceArns=[listener["ListenerArn"]]
-                                    )
-                                    tags = (
-                                        tags_response["TagDescriptions"][0]["Tags"]
-                                        if tags_response["TagDescriptions"]
-                                        else []
-                                    )
-                                except Exception:
-                                    tags = []
-
-                                # Get rules
-                                try:
-                                    rules = self.client.describe_rules(
-                                        ListenerArn=listener["ListenerArn"]
-                                    ).get("Rules", [])
-                                except Exception:
-                                    rules = []
-
-                                resources.append(
-                                    {
-                                        "type": "aws_lb_listener",
-                                        "id": listener["ListenerArn"].split("/")[-1],
-                                        "arn": listener["ListenerArn"],
-                                        "tags": tags,
-                                        "details": {
-                                            "load_balancer_arn": lb["LoadBalancerArn"],
-                                            "port": listener.get("Port"),
-                                            "protocol": listener.get("Protocol"),
-                                            "ssl_policy": listener.get("SslPolicy"),
-                                            "certificates": [
-                                                {
-                                                    "arn": cert.get("CertificateArn"),
-                                                    "is_default": cert.get(
-                                                        "IsDefault", False
-                                                    ),
-                                                }
-                                                for cert in listener.get(
-                                                    "Certificates", []
-                                                )
-                                            ],
-                                            "rules": [
-                                                {
-                                                    "arn": rule["RuleArn"],
-                                                    "priority": rule.get("Priority"),
-                                                    "conditions": rule.get(
-                                                        "Conditions", []
-                                                    ),
-                                                    "actions": rule.get("Actions", []),
-                                                }
-                                                for rule in rules
-                                                if rule.get("IsDefault", False)
-                                                is False  # Skip default rules
-                                            ],
-                                        },
-                                    }
-                                )
-                    except Exception as e:
-                        print(
-                            f"Error collecting listeners for LB {lb['LoadBalancerArn']}: {e}"
-                        )
-        except Exception as e:
-            print(f"Error collecting listeners and rules: {e}")
-        return resources
+            lb_listeners = self._list_listeners()
+            listener_arns = [listener["ListenerArn"] for _, listener in lb_listeners]
+            tag_lists = self._get_tags(listener_arns)
+            rule_lists = self.parallel_map(self._fetch_rules, listener_arns)
+
+            for (lb, listener), tags, rules in zip(lb_listeners, tag_lists, rule_lists):
+                yield self._build_listener(lb, listener, tags, rules)
+        except Exception:
+            logger.exception("Error collecting listeners and rules")
+
+    def _collect_listener_rules(self) -> Iterator[Dict[str, Any]]:
+        """Collect non-default listener rules as resources of their own"""
+        try:
+            listener_arns = [
+                listener["ListenerArn"] for _, listener in self._list_listeners()
+            ]
+            rule_lists = self.parallel_map(self._fetch_rules, listener_arns)
+            listener_rules = [
+                (listener_arn, rule)
+                for listener_arn, rules in zip(listener_arns, rule_lists)
+                for rule in rules
+                if rule.get("IsDefault", False) is False  # Skip default rules
+            ]
+            tag_lists = self._get_tags(
+                [rule["RuleArn"] for _, rule in listener_rules],
+                tag_filters=ELB_RULE_TAG_FILTERS,
+            )
+
+            for (listener_arn, rule), tags in zip(listener_rules, tag_lists):
+                yield {
+                    "type": "aws_lb_listener_rule",
+                    "id": rule["RuleArn"],
+                    "arn": rule["RuleArn"],
+                    "tags": tags,
+                    "details": {
+                        "listener_arn": listener_arn,
+                        "priority": rule.get("Priority"),
+                        "conditions": rule.get("Conditions", []),
+                        "actions": rule.get("Actions", []),
+                    },
+                }
+        except Exception:
+            logger.exception("Error collecting listener rules")
+
+    def _list_listeners(self) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """List the listeners of every ALB and NLB with their load balancer"""
+        lbs = self._list_load_balancers()
+        listener_paginator = self.get_paginator("describe_listeners")
+        listener_lists = self.parallel_map(
+            lambda lb_arn: self._fetch_listeners(lb_arn, paginator=listener_paginator),
+            [lb["LoadBalancerArn"] for lb in lbs],
+        )
+        return [
+            (lb, listener)
+            for lb, listeners in zip(lbs, listener_lists)
+            if listeners is not None
+            for listener in listeners
+        ]
+
+    def _list_load_balancers(self) -> List[Dict[str, Any]]:
+        """List ALBs and NLBs, fetched once per collection"""
+        with self._load_balancers_lock:
+            if self._load_balancers_cache is None:
+                paginator = self.get_paginator("describe_load_balancers")
+                self._load_balancers_cache = [
+                    lb
+                    for page in paginator.paginate(
+                        PaginationConfig=ELB_PAGINATION_CONFIG
+                    )
+                    for lb in page["LoadBalancers"]
+                ]
+            return self._load_balancers_cache
+
+    @staticmethod
+    def _build_listener(
+        lb: Dict[str, Any],
+        listener: Dict[str, Any],
+        tags: List[Dict[str, str]],
+        rules: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the resource for a listener and its non-default rules"""
+        return {
+            "type": "aws_lb_listener",
+            "id": listener["ListenerArn"].split("/")[-1],
+            "arn": listener["ListenerArn"],
+            "tags": tags,
+            "details": {
+                "load_balancer_arn": lb["LoadBalancerArn"],
+                "port": listener.get("Port"),
+                "protocol": listener.get("Protocol"),
+                "ssl_policy": listener.get("SslPolicy"),
+                "certificates": [
+                    {
+                        "arn": cert.get("CertificateArn"),
+                        "is_default": cert.get("IsDefault", False),
+                    }
+                    for cert in listener.get("Certificates", [])
+                ],
+                "rules": [
+                    {
+                        "arn": rule["RuleArn"],
+                        "priority": rule.get("Priority"),
+                        "conditions": rule.get("Conditions", []),
+                        "actions": rule.get("Actions", []),
+                    }
+                    for rule in rules
+                    if rule.get("IsDefault", False) is False  # Skip default rules
+                ],
+            },
+        }
+
+    @safe_collect("Error collecting targets for target group %s", default_factory=list)
+    def _fetch_target_health(self, tg_arn: str) -> List[Dict[str, Any]]:
+        """Get the registered targets of a target group and their health"""
+        return self.client.describe_target_health(TargetGroupArn=tg_arn).get(
+            "TargetHealthDescriptions", []
+        )
+
+    @safe_collect("Error collecting listeners for LB %s")
+    def _fetch_listeners(
+        self, lb_arn: str, paginator
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get the listeners of a load balancer, or None on failure"""
+        return [
+            listener
+            for page in paginator.paginate(
+                LoadBalancerArn=lb_arn, PaginationConfig=ELB_PAGINATION_CONFIG
+            )
+            for listener in page["Listeners"]
+        ]
+
+    @safe_collect("Error collecting rules for listener %s", default_factory=list)
+    def _fetch_rules(self, listener_arn: str) -> List[Dict[str, Any]]:
+        """Get the rules of a listener"""
+        return self.client.describe_rules(ListenerArn=listener_arn).get("Rules", [])
+
+    def _get_tags(
+        self, resource_arns: List[str], tag_filters: Sequence[str] = ELB_TAG_FILTERS
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Get the tags of each resource, in order.
+
+        Tags come from the Resource Groups Tagging API (queried with
+        tag_filters) when it is available, otherwise from batched DescribeTags
+        calls.
+        """
+        if not self.include_tags:
+            return [[] for _ in resource_arns]
+
+        tags_by_arn = self.get_tags_by_arn(tag_filters)
+        if tags_by_arn is not None:
+            return [tags_by_arn.get(arn, []) for arn in resource_arns]
+
+        tags_by_arn = {}
+        for batch_tags in self.parallel_map(
+            self._fetch_tags, chunked(resource_arns, DESCRIBE_TAGS_BATCH_SIZE)
+        ):
+            tags_by_arn.update(batch_tags)
+        return [tags_by_arn.get(arn, []) for arn in resource_arns]
+
+    @safe_collect("Error collecting tags for %s", default_factory=dict)
+    def _fetch_tags(self, resource_arns: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Get the tags of up to 20 ELBv2 resources"""
+        response = self.client.describe_tags(ResourceArns=resource_arns)
+        return {
+            description["ResourceArn"]: self.tag_cache.intern(description["Tags"])
+            for description in response["TagDescriptions"]
+        }
 
 
 @register_collector
@@ -395,67 +578,99 @@ class ClassicLoadBalancerCollector(ResourceCollector):
     def get_resource_types(self) -> Dict[str, str]:
         return {"aws_elb": "Legacy Load Balancers"}
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
         try:
-            paginator = self.client.get_paginator("describe_load_balancers")
-            for page in paginator.paginate():
-                for lb in page["LoadBalancerDescriptions"]:
-                    # Get tags
-                    try:
-                        tags_response = self.client.describe_tags(
-                            LoadBalancerNames=[lb["LoadBalancerName"]]
-                        )
-                        tags = (
-                            tags_response["TagDescriptions"][0]["Tags"]
-                            if tags_response["TagDescriptions"]
-                            else []
-                        )
-                    except Exception:
-                        tags = []
-
-                    resources.append(
-                        {
-                            "type": "aws_elb",
-                            "id": lb["LoadBalancerName"],
-                            "arn": f"arn:aws:elasticloadbalancing:{self.session.region_name}:{self.account_id}:loadbalancer/{lb['LoadBalancerName']}",
-                            "tags": tags,
-                            "details": {
-                                "dns_name": lb.get("DNSName"),
-                                "scheme": lb.get("Scheme"),
-                                "vpc_id": lb.get("VPCId"),
-                                "subnets": lb.get("Subnets", []),
-                                "security_groups": lb.get("SecurityGroups", []),
-                                "instances": [
-                                    instance["InstanceId"]
-                                    for instance in lb.get("Instances", [])
-                                ],
-                                "listeners": [
-                                    {
-                                        "protocol": listener.get("Protocol"),
-                                        "load_balancer_port": listener.get(
-                                            "LoadBalancerPort"
-                                        ),
-                                        "instance_protocol": listener.get(
-                                            "InstanceProtocol"
-                                        ),
-                                        "instance_port": listener.get("InstancePort"),
-                                        "ssl_certificate_id": listener.get(
-                                            "SSLCertificateId"
-                                        ),
-                                    }
-                                    for listener in lb.get("ListenerDescriptions", [])
-                                ],
-                                "health_check": lb.get("HealthCheck"),
-                            },
-                        }
+            paginator = self.get_paginator("describe_load_balancers")
+            lbs = [
+                lb
+                for page in paginator.paginate(PaginationConfig=ELB_PAGINATION_CONFIG)
+                for lb in page["LoadBalancerDescriptions"]
+            ]
+            arn_prefix = (
+                f"arn:aws:elasticloadbalancing:{self.region}:"
+                f"{self.account_id}:loadbalancer/"
+            )
+            tags_by_arn = (
+                self.get_tags_by_arn(ELB_TAG_FILTERS) if self.include_tags else {}
+            )
+            if tags_by_arn is not None:
+                tags_by_name = {
+                    lb["LoadBalancerName"]: tags_by_arn.get(
+                        arn_prefix + lb["LoadBalancerName"], []
                     )
+                    for lb in lbs
+                }
+            else:
+                tags_by_name = {}
+                for batch_tags in self.parallel_map(
+                    self._fetch_tags,
+                    chunked(
+                        [lb["LoadBalancerName"] for lb in lbs],
+                        DESCRIBE_TAGS_BATCH_SIZE,
+                    ),
+                ):
+                    tags_by_name.update(batch_tags)
+
+            resources = [
+                self._build_load_balancer(
+                    lb,
+                    arn_prefix + lb["LoadBalancerName"],
+                    tags_by_name.get(lb["LoadBalancerName"], []),
+                )
+                for lb in lbs
+            ]
 
             if self.progress_callback:
                 self.progress_callback("elb", "Completed", len(resources))
 
         except Exception as e:
+            logger.exception("Error collecting classic load balancers")
             if self.progress_callback:
                 self.progress_callback("elb", f"Error: {str(e)}", 0)
 
         return resources
+
+    @staticmethod
+    def _build_load_balancer(
+        lb: Dict[str, Any], arn: str, tags: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Build the resource for a classic load balancer"""
+        return {
+            "type": "aws_elb",
+            "id": lb["LoadBalancerName"],
+            "arn": arn,
+            "tags": tags,
+            "details": {
+                "dns_name": lb.get("DNSName"),
+                "scheme": lb.get("Scheme"),
+                "vpc_id": lb.get("VPCId"),
+                "subnets": lb.get("Subnets", []),
+                "security_groups": lb.get("SecurityGroups", []),
+                "instances": [
+                    instance["InstanceId"] for instance in lb.get("Instances", [])
+                ],
+                "listeners": [
+                    {
+                        "protocol": listener.get("Protocol"),
+                        "load_balancer_port": listener.get("LoadBalancerPort"),
+                        "instance_protocol": listener.get("InstanceProtocol"),
+                        "instance_port": listener.get("InstancePort"),
+                        "ssl_certificate_id": listener.get("SSLCertificateId"),
+                    }
+                    for listener in lb.get("ListenerDescriptions", [])
+                ],
+                "health_check": lb.get("HealthCheck"),
+            },
+        }
+
+    @safe_collect("Error collecting tags for %s", default_factory=dict)
+    def _fetch_tags(
+        self, load_balancer_names: List[str]
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """Get the tags of up to 20 classic load balancers, keyed by name"""
+        response = self.client.describe_tags(LoadBalancerNames=load_balancer_names)
+        return {
+            description["LoadBalancerName"]: self.tag_cache.intern(description["Tags"])
+            for description in response["TagDescriptions"]
+        }
@@ -2,6 +2,12 @@
 
 from typing import Dict, List, Any
 from .base import ResourceCollector, register_collector
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Largest page size accepted by KMS ListKeys (the default is 100)
+KMS_PAGINATION_CONFIG = {"PageSize": 1000}
 
 
 @register_collector
@@ -18,8 +24,8 @@ class KMSCollector(ResourceCollector):
         resources = []
 
         try:
-            paginator = self.client.get_paginator("list_keys")
-            for page in paginator.paginate():
+            paginator = self.get_paginator("list_keys")
+            for page in paginator.paginate(PaginationConfig=KMS_PAGINATION_CONFIG):
                 for key in page["Keys"]:
                     key_id = key["KeyId"]
                     try:
@@ -27,10 +33,14 @@ class KMSCollector(ResourceCollector):
                         if (
                             key_info["KeyManager"] == "CUSTOMER"
                         ):  # Only collect customer-managed keys
-                            tags = self.client.list_resource_tags(KeyId=key_id)["Tags"]
+                            tags = (
+                                self.client.list_resource_tags(KeyId=key_id)["Tags"]
+                                if self.include_tags
+                                else []
+                            )
                             resources.append(
                                 {
-                                    "type": "key",
+                                    "type": "aws_kms_key",
                                     "id": key_id,
                                     "arn": key_info["Arn"],
                                     "tags": tags,
@@ -38,8 +48,8 @@ class KMSCollector(ResourceCollector):
                             )
                     except self.client.exceptions.NotFoundException:
                         continue
-        except Exception as e:
-            print(f"Error collecting KMS resources: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting KMS resources")
 
         return resources
 
@@ -54,22 +64,22 @@ class SecretsManagerCollector(ResourceCollector):
     def get_resource_types(self) -> Dict[str, str]:
         return {"aws_secretsmanager_secret": "Secrets Manager Secrets"}
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
-            paginator = self.client.get_paginator("list_secrets")
+            paginator = self.get_paginator("list_secrets")
             for page in paginator.paginate():
                 for secret in page["SecretList"]:
                     resources.append(
                         {
-                            "type": "secret",
+                            "type": "aws_secretsmanager_secret",
                             "id": secret["Name"],
                             "arn": secret["ARN"],
                             "tags": secret.get("Tags", []),
                         }
                     )
-        except Exception as e:
-            print(f"Error collecting Secrets Manager resources: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting Secrets Manager resources")
 
         return resources
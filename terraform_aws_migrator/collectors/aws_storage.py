@@ -1,6 +1,7 @@
 # resource_collectors/storage.py
 
 from typing import Dict, List, Any
+from botocore.exceptions import BotoCoreError, ClientError
 from .base import ResourceCollector, register_collector
 import logging
 
@@ -23,12 +24,15 @@ class S3Collector(ResourceCollector):
         try:
             for bucket in self.client.list_buckets()["Buckets"]:
                 bucket_name = bucket["Name"]
-                try:
-                    tags = self.client.get_bucket_tagging(Bucket=bucket_name).get(
-                        "TagSet", []
-                    )
-                except:  # noqa: E722
-                    tags = []
+                tags = []
+                if self.include_tags:
+                    try:
+                        tags = self.client.get_bucket_tagging(Bucket=bucket_name).get(
+                            "TagSet", []
+                        )
+                    except (BotoCoreError, ClientError):
+                        # NoSuchTagSet when the bucket has no tags
+                        tags = []
 
                 resources.append(
                     {
@@ -38,8 +42,8 @@ class S3Collector(ResourceCollector):
                         "tags": tags,
                     }
                 )
-        except Exception as e:
-            print(f"Error collecting S3 buckets: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting S3 buckets")
 
         return resources
 
@@ -55,11 +59,11 @@ class EFSCollector(ResourceCollector):
     def get_resource_types(self) -> Dict[str, str]:
         return {"aws_efs_file_system": "EFS File Systems"}
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
-            paginator = self.client.get_paginator("describe_file_systems")
+            paginator = self.get_paginator("describe_file_systems")
             for page in paginator.paginate():
                 for fs in page["FileSystems"]:
                     resources.append(
@@ -70,8 +74,8 @@ class EFSCollector(ResourceCollector):
                             "tags": fs.get("Tags", []),
                         }
                     )
-        except Exception as e:
-            print(f"Error collecting EFS filesystems: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting EFS filesystems")
 
         return resources
 
@@ -112,11 +116,11 @@ class EBSCollector(ResourceCollector):
         # Volume is attached and all attachments have DeleteOnTermination=True
         return False
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, target_resource_type: str = "") -> List[Dict[str, Any]]:
         resources = []
 
         try:
-            paginator = self.client.get_paginator("describe_volumes")
+            paginator = self.get_paginator("describe_volumes")
             for page in paginator.paginate():
                 for volume in page["Volumes"]:
                     # Only include volumes that should be explicitly managed
@@ -148,7 +152,7 @@ class EBSCollector(ResourceCollector):
                         }
                     )
 
-        except Exception as e:
-            logger.error(f"Error collecting EBS volumes: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting EBS volumes")
 
         return resources
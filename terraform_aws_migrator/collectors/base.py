@@ -1,10 +1,210 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional, Sequence
+import functools
+import importlib
+import os
+import threading
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Region that indexes global services (IAM, CloudFront, Route 53) for APIs such
+# as the Resource Groups Tagging API
+GLOBAL_SERVICE_REGION = "us-east-1"
+
+# Number of worker threads used to fan out per-resource API calls
+MAX_WORKERS = int(os.environ.get("TF_AWS_MIGRATOR_MAX_WORKERS", "16"))
+
+# Largest page size accepted by IAM list operations (their MaxItems limit)
+IAM_PAGINATION_CONFIG = {"PageSize": 1000}
+
+# Configuration for shared clients: a connection pool large enough for the
+# worker threads, kept-alive connections, and adaptive retries so throttled
+# fan-outs back off instead of failing. Worker pools never nest (see
+# new_worker_pool), so at most MAX_WORKERS calls share a client at once.
+CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_WORKERS,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_session() -> boto3.Session:
+    """
+    Get the process-wide default session.
+
+    Collectors created without an explicit session share this one, and with it
+    the credential resolver and the clients cached by get_shared_client.
+    """
+    return boto3.Session()
+
+
+# Guards client creation: boto3 sessions are not thread-safe, while clients are
+_client_lock = threading.Lock()
+
+# Marks the threads of worker pools, see new_worker_pool
+_worker_thread = threading.local()
+
+
+def _mark_worker_thread():
+    _worker_thread.active = True
+
+
+def in_worker_pool() -> bool:
+    """Whether the calling thread belongs to a worker pool"""
+    return getattr(_worker_thread, "active", False)
+
+
+def new_worker_pool(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Create a thread pool for concurrent AWS API calls.
+
+    Fan-outs started from one of its threads (see
+    ResourceCollector.parallel_map) run serially, so nested pools never
+    multiply the thread count beyond max_workers.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=_mark_worker_thread)
+
+
+@functools.lru_cache(maxsize=None)
+def _create_shared_client(
+    session: boto3.Session, service_name: str, region_name: Optional[str]
+):
+    logger.debug("Created client for service: %s", service_name)
+    return session.client(service_name, region_name=region_name, config=CLIENT_CONFIG)
+
+
+def get_shared_client(
+    session: boto3.Session, service_name: str, region_name: Optional[str] = None
+):
+    """
+    Get a client shared by every collector using the same session.
+
+    Collectors for the same service (e.g. the IAM role, user, group and policy
+    collectors) reuse one client, so the service model is loaded once and the
+    HTTPS connection pool is shared. Safe to call from collector threads.
+    """
+    with _client_lock:
+        return _create_shared_client(session, service_name, region_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_paginator(client, operation_name: str):
+    """
+    Get a paginator for a client operation, created once per client.
+
+    botocore builds a new paginator class on every get_paginator call;
+    paginators keep no state between paginate() calls, so one instance can be
+    reused across collectors and threads.
+    """
+    return client.get_paginator(operation_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_account_id(session: boto3.Session) -> str:
+    """Get the AWS account id for a session, calling STS once per session"""
+    return get_shared_client(session, "sts").get_caller_identity()["Account"]
+
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split items into consecutive batches of at most size items"""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def matches_target(resource_type: str, target_resource_type: Optional[str]) -> bool:
+    """Whether resource_type should be collected for a (possibly empty) target"""
+    return not target_resource_type or resource_type == target_resource_type
+
+
+def safe_collect(message: str, default_factory: Optional[Callable[[], Any]] = None):
+    """
+    Decorator for collector methods that fetch details of a single resource.
+
+    Errors are logged to the decorated function's module logger and a default
+    value is returned instead, so one failing resource does not abort a whole
+    collection. AWS API errors (e.g. AccessDenied) are logged without a
+    traceback, unexpected errors with one. Throttling is retried by the
+    client's retry configuration before an error reaches this point.
+
+    Args:
+        message: Log message, with one %s placeholder per positional argument
+            of the decorated method (excluding self)
+        default_factory: Called to build the value returned when the method
+            raises (e.g. list), so failures never share a mutable default.
+            None is returned when omitted
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func_logger = logging.getLogger(func.__module__)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except ClientError as e:
+                func_logger.error(message + ": %s", *args, e)
+            except Exception:
+                func_logger.exception(message, *args)
+            return default_factory() if default_factory is not None else None
+
+        return wrapper
+
+    return decorator
+
+
+class TagCache:
+    """
+    Tagging API indexes and interned tag lists shared by the collectors of
+    one audit run.
+
+    Create one per audit and pass it to every collector, so collectors asking
+    for the same type filters and region share one lookup and the cached tags
+    are dropped with the run. Each key has its own lock: collectors (or
+    collector stages) running concurrently wait for one lookup instead of
+    repeating it.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[tuple, Dict[str, List[Dict[str, str]]]] = {}
+        self._locks: Dict[tuple, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        # One shared list per distinct tag set, see intern
+        self._interned: Dict[tuple, List[Dict[str, str]]] = {}
+
+    def intern(self, tags: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Get a shared list equal to tags, so resources with the same tags share one.
+
+        Accounts with standardized tagging carry the same tag set on many
+        resources. Records treat tags as read-only, so they can share a list.
+        """
+        key = tuple((tag["Key"], tag["Value"]) for tag in tags)
+        return self._interned.setdefault(key, tags)
+
+    def get_index(
+        self, key: tuple, fetch: Callable[[], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        """
+        Get the index stored under key, calling fetch on the first request.
+
+        A None result (a failed lookup) is returned but not stored, so the
+        next request tries again.
+        """
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key in self._indexes:
+                return self._indexes[key]
+            index = fetch()
+            if index is not None:
+                self._indexes[key] = index
+            return index
+
 
 class ResourceCollector(ABC):
     """Base class for AWS resource collectors"""
@@ -13,13 +213,19 @@ class ResourceCollector(ABC):
         self,
         session: boto3.Session = None,
         progress_callback: Optional[Callable] = None,
+        include_tags: bool = True,
+        tag_cache: Optional[TagCache] = None,
     ):
         self._client = None
         self._account_id = None
         self._region = None
-        self.session = session or boto3.Session()
+        self.session = session or get_default_session()
         self.progress_callback = progress_callback
-        logger.debug(f"Initializing collector: {self.__class__.__name__}")
+        # When False, collectors skip API calls made only to fetch tags
+        self.include_tags = include_tags
+        # Shared with the other collectors of the audit when given
+        self.tag_cache = tag_cache or TagCache()
+        logger.debug("Initializing collector: %s", self.__class__.__name__)
 
     @abstractmethod
     def get_service_name(self) -> str:
@@ -40,16 +246,17 @@ class ResourceCollector(ABC):
     @property
     def client(self):
         if self._client is None:
-            self._client = self.session.client(self.get_service_name())
-            logger.debug(f"Created client for service: {self.get_service_name()}")
+            self._client = get_shared_client(self.session, self.get_service_name())
         return self._client
 
+    def get_paginator(self, operation_name: str):
+        """Get a shared paginator for an operation of this collector's client"""
+        return get_paginator(self.client, operation_name)
+
     @property
     def account_id(self):
         if self._account_id is None:
-            self._account_id = self.session.client("sts").get_caller_identity()[
-                "Account"
-            ]
+            self._account_id = get_account_id(self.session)
         return self._account_id
 
     @property
@@ -64,11 +271,70 @@ class ResourceCollector(ABC):
         """Collect resources for the service"""
         pass
 
+    def parallel_map(self, func: Callable, items: List[Any]) -> List[Any]:
+        """
+        Apply func to every item using a thread pool, preserving item order.
+
+        boto3 clients are thread-safe, so this is used to overlap independent
+        per-resource API calls. Called from a worker pool thread (e.g. while
+        the auditor runs collectors concurrently) it runs serially instead of
+        opening a nested pool. The first exception raised by func propagates
+        to the caller.
+        """
+        if len(items) <= 1 or in_worker_pool():
+            return [func(item) for item in items]
+        with new_worker_pool(min(MAX_WORKERS, len(items))) as executor:
+            return list(executor.map(func, items))
+
     @staticmethod
     def extract_tags(tags: List[Dict[str, str]]) -> Dict[str, str]:
         """Convert AWS tags list to dictionary"""
         return {tag["Key"]: tag["Value"] for tag in tags} if tags else {}
 
+    def get_tags_by_arn(
+        self, resource_type_filters: Sequence[str], region_name: Optional[str] = None
+    ) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        """
+        Bulk-fetch tags through the Resource Groups Tagging API, keyed by ARN.
+
+        The index is fetched once per tag cache (one audit run) and shared
+        by every collector asking for the same filters and region; failed
+        lookups are not cached.
+
+        Args:
+            resource_type_filters: Tagging API type filters (e.g. "iam:role")
+            region_name: Region to query, defaults to the session region
+
+        Returns:
+            Mapping of ARN to tag list, or None if the lookup failed so the
+            caller can fall back to the service's per-resource tag API
+        """
+
+        def fetch() -> Optional[Dict[str, List[Dict[str, str]]]]:
+            try:
+                client = get_shared_client(
+                    self.session, "resourcegroupstaggingapi", region_name
+                )
+                tags_by_arn = {}
+                paginator = get_paginator(client, "get_resources")
+                for page in paginator.paginate(
+                    ResourceTypeFilters=list(resource_type_filters)
+                ):
+                    for mapping in page["ResourceTagMappingList"]:
+                        tags_by_arn[mapping["ResourceARN"]] = self.tag_cache.intern(
+                            mapping.get("Tags", [])
+                        )
+                return tags_by_arn
+            except Exception as e:
+                logger.debug(
+                    "Tagging API lookup failed for %s: %s", resource_type_filters, e
+                )
+                return None
+
+        return self.tag_cache.get_index(
+            (self.session, tuple(resource_type_filters), region_name), fetch
+        )
+
     def build_arn(self, resource_type: str, resource_id: str) -> str:
         """Build ARN for a resource"""
         service = self.get_service_name()
@@ -83,26 +349,152 @@ class ResourceCollector(ABC):
             return f"arn:aws:{service}:{region}:{account}:{resource_type}/{resource_id}"
 
 
+# Collector modules (relative to this package) and the AWS services they
+# collect, in registration order. Modules are imported on demand so that
+# collecting one service does not import every collector.
+COLLECTOR_MODULES = (
+    ("aws_compute", ("ec2", "ecs", "lambda")),
+    ("aws_database", ("rds", "dynamodb", "elasticache")),
+    (
+        "aws_network",
+        ("apigateway", "apigatewayv2", "route53", "cloudfront", "elbv2", "elb"),
+    ),
+    ("aws_security", ("kms", "secretsmanager")),
+    ("aws_storage", ("s3", "efs", "ec2")),
+    ("aws_application", ("stepfunctions",)),
+    ("aws_iam.role", ("iam",)),
+    ("aws_iam.user", ("iam",)),
+    ("aws_iam.group", ("iam",)),
+    ("aws_iam.policy", ("iam",)),
+)
+
+# Resource type prefixes (the part after "aws_") that differ from the AWS
+# service name of their collector
+RESOURCE_TYPE_SERVICES = {
+    "instance": "ec2",
+    "vpc": "ec2",
+    "security": "ec2",
+    "ebs": "ec2",
+    "db": "rds",
+    "api": "apigateway",
+    "lb": "elbv2",
+    "sfn": "stepfunctions",
+}
+
+
 class CollectorRegistry:
     """Registry for resource collectors"""
 
     def __init__(self):
         self.collectors = []
+        self._resource_type_owners: Dict[str, type] = {}
+        self._loaded_modules = set()
+
+    def load_collectors(self, service_name: Optional[str] = None):
+        """
+        Import the collector modules for a service, registering their collectors
+
+        Args:
+            service_name: AWS service name (e.g. "iam"). All collector modules
+                are loaded when omitted or when no module is known to handle it
+        """
+        modules = [
+            module
+            for module, services in COLLECTOR_MODULES
+            if service_name is None or service_name in services
+        ] or [module for module, _ in COLLECTOR_MODULES]
+        for module in modules:
+            if module not in self._loaded_modules:
+                logger.debug("Loading collector module: %s", module)
+                importlib.import_module(f".{module}", __package__)
+                self._loaded_modules.add(module)
 
     def register(self, collector_class: type):
-        """Register a collector class"""
-        self.collectors.append(collector_class)
+        """
+        Register a collector class
+
+        A class with the same module and qualified name as a registered one
+        (e.g. after a module reload) replaces the stale entry.
+
+        Raises:
+            ValueError: If a resource type is already handled by another collector
+        """
+        key = (collector_class.__module__, collector_class.__qualname__)
+        stale_index = next(
+            (
+                index
+                for index, registered in enumerate(self.collectors)
+                if (registered.__module__, registered.__qualname__) == key
+            ),
+            None,
+        )
+        for resource_type in collector_class.get_resource_types():
+            owner = self._resource_type_owners.get(resource_type)
+            if owner is not None and (owner.__module__, owner.__qualname__) != key:
+                raise ValueError(
+                    f"Resource type {resource_type} is already registered by "
+                    f"{owner.__name__}, cannot register {collector_class.__name__}"
+                )
+        if stale_index is None:
+            self.collectors.append(collector_class)
+        else:
+            logger.debug("Replacing registered collector: %s", collector_class.__name__)
+            stale_class = self.collectors[stale_index]
+            self._resource_type_owners = {
+                resource_type: owner
+                for resource_type, owner in self._resource_type_owners.items()
+                if owner is not stale_class
+            }
+            self.collectors[stale_index] = collector_class
+        for resource_type in collector_class.get_resource_types():
+            self._resource_type_owners[resource_type] = collector_class
         return collector_class
 
-    def get_collectors(self, session: boto3.Session) -> List[ResourceCollector]:
-        """Get all collector instances with the given session"""
-        logger.debug(f"Getting collectors, total registered: {len(self.collectors)}")
+    def get_collector_class(self, resource_type: str) -> Optional[type]:
+        """
+        Get the collector class registered for a resource type
+
+        Args:
+            resource_type: Terraform resource type (e.g. "aws_lb")
+
+        Returns:
+            The collector class, or None if no collector handles the type
+        """
+        if resource_type not in self._resource_type_owners:
+            prefix = resource_type.split("_")[1] if "_" in resource_type else ""
+            service_name = RESOURCE_TYPE_SERVICES.get(prefix, prefix)
+            if any(service_name in services for _, services in COLLECTOR_MODULES):
+                self.load_collectors(service_name)
+        if resource_type not in self._resource_type_owners:
+            self.load_collectors()
+        return self._resource_type_owners.get(resource_type)
+
+    def get_collectors(
+        self,
+        session: boto3.Session,
+        service_name: Optional[str] = None,
+        include_tags: bool = True,
+        tag_cache: Optional[TagCache] = None,
+    ) -> List[ResourceCollector]:
+        """
+        Get collector instances with the given session
+
+        Args:
+            session: boto3 session passed to every collector
+            service_name: Only load the collector modules for this service
+            include_tags: Whether collectors fetch resource tags
+            tag_cache: Tag cache shared by the collectors, one per audit run
+        """
+        self.load_collectors(service_name)
+        logger.debug("Getting collectors, total registered: %s", len(self.collectors))
         instances = []
         for collector_cls in self.collectors:
             try:
-                collector = collector_cls(session)
+                collector = collector_cls(
+                    session, include_tags=include_tags, tag_cache=tag_cache
+                )
                 instances.append(collector)
-                logger.debug(f"Initialized collector: {collector_cls.__name__}")
+                logger.debug("Initialized collector: %s", collector_cls.__name__)
             except Exception as e:
                 logger.error(
                     f"Failed to initialize collector {collector_cls.__name__}: {e}"
@@ -110,7 +502,8 @@ class CollectorRegistry:
         return instances
 
     def iter_classes(self):
-        """Iterator over collector classes"""
+        """Iterator over all collector classes"""
+        self.load_collectors()
         return iter(self.collectors)
 
     def __iter__(self):
@@ -118,7 +511,8 @@ class CollectorRegistry:
         return self.iter_classes()
 
     def __len__(self):
-        """Get number of registered collectors"""
+        """Get number of available collectors"""
+        self.load_collectors()
         return len(self.collectors)
 
 
@@ -128,5 +522,5 @@ registry = CollectorRegistry()
 
 def register_collector(collector_class: type):
     """Decorator to register a collector class"""
-    logger.debug(f"Registering collector class: {collector_class.__name__}")
+    logger.debug("Registering collector class: %s", collector_class.__name__)
     return registry.register(collector_class)
@@ -1,7 +1,7 @@
 # terraform_aws_migrator/exclusion.py
 
 from pathlib import Path
-from typing import List, Set, Pattern
+from typing import List, Set, Pattern, Optional
 import re
 import fnmatch
 import logging
@@ -18,6 +18,7 @@ class ResourceExclusionConfig:
         self.exclusion_file = exclusion_file or self.DEFAULT_FILENAME
         self.patterns: List[str] = []
         self.regex_patterns: List[Pattern] = []
+        self.combined_pattern: Optional[Pattern] = None
         self._load_patterns()
 
     def _load_patterns(self) -> None:
@@ -41,6 +42,12 @@ class ResourceExclusionConfig:
                             regex_pattern = fnmatch.translate(line)
                             self.regex_patterns.append(re.compile(regex_pattern))
 
+            # Match all patterns in a single regex pass per value
+            if self.regex_patterns:
+                self.combined_pattern = re.compile(
+                    "|".join(pattern.pattern for pattern in self.regex_patterns)
+                )
+
             logger.info(
                 f"Loaded {len(self.patterns)} exclusion patterns from {self.exclusion_file}"
             )
@@ -49,6 +56,7 @@ class ResourceExclusionConfig:
             logger.error(f"Error loading exclusion patterns: {str(e)}")
             self.patterns = []
             self.regex_patterns = []
+            self.combined_pattern = None
 
     def should_exclude(self, resource: dict) -> bool:
         """
@@ -60,7 +68,7 @@ class ResourceExclusionConfig:
         Returns:
             bool: True if the resource should be excluded, False otherwise
         """
-        if not self.patterns:
+        if not self.combined_pattern:
             return False
 
         # Values to check against patterns
@@ -84,12 +92,14 @@ class ResourceExclusionConfig:
 
         # Check if any value matches any pattern
         for value in check_values:
-            for pattern in self.regex_patterns:
-                if pattern.match(str(value)):
+            value = str(value)
+            if self.combined_pattern.match(value):
+                if logger.isEnabledFor(logging.DEBUG):
+                    pattern = next(p for p in self.regex_patterns if p.match(value))
                     logger.debug(
                         f"Resource {value} excluded by pattern {pattern.pattern}"
                     )
-                    return True
+                return True
 
         return False
 
@@ -11,12 +11,37 @@ from ..collectors.base import registry
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_json(data: Any) -> str:
+    """
+    Serialize data as indented JSON, using orjson when it is installed.
+
+    Both paths write non-ASCII text (e.g. tag values) as raw UTF-8 and
+    datetimes through str(), so the output does not depend on the extra.
+    """
+    if orjson is not None:
+        # Pass datetimes through to default=str, as the json fallback does
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(data, indent=2, default=str, ensure_ascii=False)
+
+
 def format_output(
     resources: Dict[str, List[Dict[str, Any]]], output_format: str = "text"
 ) -> str:
     try:
         if output_format == "json":
-            return json.dumps(resources, indent=2, default=str)
+            return _dumps_json(resources)
 
         if not resources:
             return "No unmanaged resources found."
@@ -2,13 +2,14 @@
 
 import argparse
 import logging
-import traceback
 from rich.console import Console
 from terraform_aws_migrator.utils.resource_utils import show_supported_resources
 from terraform_aws_migrator.auditor import AWSResourceAuditor
 from terraform_aws_migrator.formatters.output_formatter import format_output
 from terraform_aws_migrator.generators import HCLGeneratorRegistry
 
+logger = logging.getLogger(__name__)
+
 
 def setup_logging(debug: bool = False):
     """Configure logging settings"""
@@ -56,6 +57,11 @@ def main():
         help="Path to resource exclusion file (default: .tfignore)",
         metavar="FILE",
     )
+    parser.add_argument(
+        "--no-tags",
+        action="store_true",
+        help="Skip fetching resource tags (fewer AWS API calls)",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     # HCL generation arguments
@@ -98,7 +104,9 @@ def main():
                 return 1
 
             auditor = AWSResourceAuditor(
-                exclusion_file=args.ignore_file, target_resource_type=args.type
+                exclusion_file=args.ignore_file,
+                target_resource_type=args.type,
+                include_tags=not args.no_tags,
             )
             unmanaged_resources = auditor.audit_specific_resource(
                 args.tf_dir, args.type
@@ -129,7 +137,9 @@ def main():
 
         else:
             # Normal mode
-            auditor = AWSResourceAuditor(exclusion_file=args.ignore_file)
+            auditor = AWSResourceAuditor(
+                exclusion_file=args.ignore_file, include_tags=not args.no_tags
+            )
             unmanaged_resources = auditor.audit_all_resources(args.tf_dir)
 
             # Format and display the output
@@ -142,20 +152,12 @@ def main():
             else:
                 console.print(formatted_output)
 
-            # Write the output
-            if args.output_file:
-                with open(args.output_file, "w") as f:
-                    f.write(formatted_output)
-                console.print(f"[green]Detection results written to {args.output_file}")
-            else:
-                console.print(formatted_output)
-
     except KeyboardInterrupt:
         console.print("\n[yellow]Detection cancelled by user")
         return 1
     except Exception as e:
+        logger.exception("Error during detection")
         console.print(f"[red]Error during detection: {str(e)}")
-        console.print(f"[red]Error during detection: {traceback.format_exc()}")
         return 1
 
     return 0
@@ -6,6 +6,7 @@ from typing import Dict, List, Any, Set, Optional
 import boto3
 import hcl2
 from rich.console import Console
+from terraform_aws_migrator.collectors.base import get_account_id, get_shared_client
 import logging
 import traceback
 
@@ -23,9 +24,7 @@ class TerraformStateReader:
     @property
     def account_id(self):
         if not self._account_id:
-            self._account_id = self.session.client("sts").get_caller_identity()[
-                "Account"
-            ]
+            self._account_id = get_account_id(self.session)
         return self._account_id
 
     def read_backend_config(self, tf_dir: str, progress=None) -> List[Dict[str, Any]]:
@@ -223,7 +222,7 @@ class TerraformStateReader:
     ) -> Optional[Dict[str, Any]]:
         """Read Terraform state file from S3"""
         try:
-            s3_client = self.session.client("s3", region_name=region)
+            s3_client = get_shared_client(self.session, "s3", region)
             response = s3_client.get_object(Bucket=bucket, Key=key)
             return json.loads(response["Body"].read().decode("utf-8"))
         except Exception as e:
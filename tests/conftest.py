@@ -0,0 +1,28 @@
+# tests/conftest.py
+
+import os
+
+import boto3
+import pytest
+from moto import mock_aws
+
+# Set before any boto3 session is created: the default session is shared by
+# the whole process and resolves its region and credentials once
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_SECURITY_TOKEN"] = "testing"
+os.environ["AWS_SESSION_TOKEN"] = "testing"
+
+
+@pytest.fixture
+def aws():
+    """Mocked AWS account, reset for every test"""
+    with mock_aws():
+        yield
+
+
+@pytest.fixture
+def session(aws):
+    """boto3 session for the mocked account"""
+    return boto3.Session(region_name="us-east-1")
@@ -0,0 +1,147 @@
+# tests/test_base.py
+
+import importlib
+import logging
+
+import pytest
+from botocore.exceptions import ClientError
+
+from terraform_aws_migrator.collectors.base import (
+    CollectorRegistry,
+    ResourceCollector,
+    TagCache,
+    chunked,
+    matches_target,
+    registry,
+    safe_collect,
+)
+
+
+class _Fetcher:
+    @safe_collect("Error fetching %s", default_factory=list)
+    def fetch_list(self, name):
+        raise ClientError({"Error": {"Code": "AccessDenied"}}, "Fetch")
+
+    @safe_collect("Error fetching %s")
+    def fetch_none(self, name):
+        raise RuntimeError(name)
+
+    @safe_collect("Error fetching %s", default_factory=list)
+    def fetch_ok(self, name):
+        return [name]
+
+
+def _collector_class(name, module, resource_types):
+    """Build a collector class as if it were defined in another module"""
+
+    def get_service_name(cls):
+        return "test"
+
+    def get_resource_types(cls):
+        return resource_types
+
+    def collect(self, target_resource_type=""):
+        return []
+
+    return type(
+        name,
+        (ResourceCollector,),
+        {
+            "__module__": module,
+            "get_service_name": classmethod(get_service_name),
+            "get_resource_types": classmethod(get_resource_types),
+            "collect": collect,
+        },
+    )
+
+
+def test_safe_collect_returns_a_new_default_per_failure(caplog):
+    fetcher = _Fetcher()
+    with caplog.at_level(logging.ERROR):
+        first = fetcher.fetch_list("a")
+        second = fetcher.fetch_list("b")
+    assert first == second == []
+    assert first is not second
+    assert "Error fetching a" in caplog.text
+
+
+def test_safe_collect_defaults_to_none_and_passes_results_through():
+    fetcher = _Fetcher()
+    assert fetcher.fetch_none("a") is None
+    assert fetcher.fetch_ok("a") == ["a"]
+
+
+def test_chunked():
+    assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert chunked([], 20) == []
+
+
+def test_matches_target():
+    assert matches_target("aws_iam_group", "")
+    assert matches_target("aws_iam_group", None)
+    assert matches_target("aws_iam_group", "aws_iam_group")
+    assert not matches_target("aws_iam_group", "aws_iam_user")
+
+
+def test_tag_cache_does_not_store_failed_lookups():
+    cache = TagCache()
+    assert cache.get_index(("key",), lambda: None) is None
+    assert cache.get_index(("key",), lambda: {"arn": []}) == {"arn": []}
+    assert cache.get_index(("key",), lambda: {}) == {"arn": []}
+
+
+def test_tag_cache_interns_equal_tag_sets():
+    cache = TagCache()
+    tags = cache.intern([{"Key": "env", "Value": "prod"}])
+    assert cache.intern([{"Key": "env", "Value": "prod"}]) is tags
+    assert TagCache().intern([{"Key": "env", "Value": "prod"}]) is not tags
+
+
+def test_registry_rejects_resource_type_clash_from_another_class():
+    test_registry = CollectorRegistry()
+    test_registry.register(_collector_class("Collector", "mod_a", {"aws_x": "X"}))
+    with pytest.raises(ValueError):
+        test_registry.register(_collector_class("Collector", "mod_b", {"aws_x": "X"}))
+    with pytest.raises(ValueError):
+        test_registry.register(_collector_class("Other", "mod_a", {"aws_x": "X"}))
+    assert len(test_registry.collectors) == 1
+
+
+def test_registry_replaces_re_registered_class():
+    test_registry = CollectorRegistry()
+    old = _collector_class("Collector", "mod_a", {"aws_x": "X", "aws_y": "Y"})
+    new = _collector_class("Collector", "mod_a", {"aws_x": "X"})
+    test_registry.register(old)
+    test_registry.register(new)
+    assert test_registry.collectors == [new]
+    assert test_registry._resource_type_owners == {"aws_x": new}
+
+
+def test_module_reload_does_not_grow_registry():
+    count = len(registry)
+    module = importlib.import_module("terraform_aws_migrator.collectors.aws_network")
+    module = importlib.reload(module)
+    assert len(registry) == count
+    assert registry.get_collector_class("aws_lb") is module.LoadBalancerV2Collector
+
+
+@pytest.mark.parametrize(
+    "resource_type, collector_name",
+    [
+        ("aws_instance", "EC2Collector"),
+        ("aws_ebs_volume", "EBSCollector"),
+        ("aws_db_instance", "RDSCollector"),
+        ("aws_lb", "LoadBalancerV2Collector"),
+        ("aws_lb_listener_rule", "LoadBalancerV2Collector"),
+        ("aws_elb", "ClassicLoadBalancerCollector"),
+        ("aws_api_gateway_rest_api", "APIGatewayCollector"),
+        ("aws_sfn_state_machine", "StepFunctionCollector"),
+        ("aws_iam_user_policy", "IAMUserCollector"),
+    ],
+)
+def test_get_collector_class(resource_type, collector_name):
+    assert registry.get_collector_class(resource_type).__name__ == collector_name
+
+
+def test_get_collector_class_unknown_type():
+    assert registry.get_collector_class("aws_unknown_thing") is None
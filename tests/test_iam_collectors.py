@@ -0,0 +1,199 @@
+# tests/test_iam_collectors.py
+
+import json
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from terraform_aws_migrator.collectors.aws_iam.authorization_details import (
+    iter_authorization_details,
+)
+from terraform_aws_migrator.collectors.aws_iam.group import IAMGroupCollector
+from terraform_aws_migrator.collectors.aws_iam.policy import IAMPolicyCollector
+from terraform_aws_migrator.collectors.aws_iam.role import IAMRoleCollector
+from terraform_aws_migrator.collectors.aws_iam.user import IAMUserCollector
+
+POLICY_DOCUMENT = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": "*"}],
+    }
+)
+ASSUME_ROLE_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Service": "ec2.amazonaws.com"},
+                "Action": "sts:AssumeRole",
+            }
+        ],
+    }
+)
+
+
+@pytest.fixture
+def iam_account(session):
+    """Account with two users, roles and groups sharing one managed policy"""
+    iam = session.client("iam")
+    policy_arn = iam.create_policy(
+        PolicyName="shared", PolicyDocument=POLICY_DOCUMENT, Description="d"
+    )["Policy"]["Arn"]
+    for i in range(2):
+        iam.create_user(UserName=f"user{i}", Tags=[{"Key": "n", "Value": str(i)}])
+        iam.put_user_policy(
+            UserName=f"user{i}", PolicyName="inline", PolicyDocument=POLICY_DOCUMENT
+        )
+        iam.attach_user_policy(UserName=f"user{i}", PolicyArn=policy_arn)
+
+        iam.create_role(
+            RoleName=f"role{i}",
+            AssumeRolePolicyDocument=ASSUME_ROLE_POLICY,
+            Tags=[{"Key": "n", "Value": str(i)}],
+        )
+        iam.put_role_policy(
+            RoleName=f"role{i}", PolicyName="inline", PolicyDocument=POLICY_DOCUMENT
+        )
+        iam.attach_role_policy(RoleName=f"role{i}", PolicyArn=policy_arn)
+
+        iam.create_group(GroupName=f"group{i}")
+        iam.add_user_to_group(GroupName=f"group{i}", UserName=f"user{i}")
+        iam.put_group_policy(
+            GroupName=f"group{i}", PolicyName="inline", PolicyDocument=POLICY_DOCUMENT
+        )
+        iam.attach_group_policy(GroupName=f"group{i}", PolicyArn=policy_arn)
+    # AWS-managed roles are never migrated
+    iam.create_role(
+        RoleName="AWSServiceRoleForTest", AssumeRolePolicyDocument=ASSUME_ROLE_POLICY
+    )
+    return session
+
+
+def _denied(*args, **kwargs):
+    raise ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+        "GetAccountAuthorizationDetails",
+    )
+
+
+def _collect_without_authorization_details(collector_cls, session, module):
+    """Collect through the per-resource fallback, without the Tagging API"""
+    with mock.patch(
+        f"terraform_aws_migrator.collectors.aws_iam.{module}"
+        ".iter_authorization_details",
+        side_effect=_denied,
+    ), mock.patch.object(collector_cls, "get_tags_by_arn", return_value=None):
+        return collector_cls(session).collect()
+
+
+def _sorted(resources):
+    return sorted(resources, key=lambda resource: (resource["type"], resource["id"]))
+
+
+def test_role_fallback_matches_authorization_details(iam_account):
+    expected = IAMRoleCollector(iam_account).collect()
+    actual = _collect_without_authorization_details(
+        IAMRoleCollector, iam_account, "role"
+    )
+
+    assert _sorted(actual) == _sorted(expected)
+    assert {(r["type"], r["id"]) for r in expected} >= {
+        ("aws_iam_role", "role0"),
+        ("aws_iam_role_policy", "role0_inline"),
+    }
+    assert "AWSServiceRoleForTest" not in {r["id"] for r in expected}
+
+
+def test_user_fallback_matches_authorization_details(iam_account):
+    expected = IAMUserCollector(iam_account).collect()
+    actual = _collect_without_authorization_details(
+        IAMUserCollector, iam_account, "user"
+    )
+
+    # The fallback lists inline policy names without their documents
+    without_documents = [
+        {key: value for key, value in resource.items() if key != "policy_document"}
+        for resource in expected
+    ]
+    assert _sorted(actual) == _sorted(without_documents)
+    assert len(expected) == 6
+    assert all(
+        "policy_document" in resource
+        for resource in expected
+        if resource["type"] == "aws_iam_user_policy"
+    )
+
+
+def test_user_collector_skips_authorization_details_after_access_denied(
+    iam_account,
+):
+    collector = IAMUserCollector(iam_account)
+    with mock.patch(
+        "terraform_aws_migrator.collectors.aws_iam.user.iter_authorization_details",
+        side_effect=_denied,
+    ) as details:
+        collector.collect()
+        collector.collect()
+    assert details.call_count == 1
+
+
+def test_group_fallback_matches_authorization_details(iam_account):
+    expected = IAMGroupCollector(iam_account).collect()
+    actual = _collect_without_authorization_details(
+        IAMGroupCollector, iam_account, "group"
+    )
+
+    assert _sorted(actual) == _sorted(expected)
+    assert [r["details"]["members"] for r in _sorted(expected)] == [
+        ["user0"],
+        ["user1"],
+    ]
+
+
+def test_policy_fallback_matches_authorization_details(iam_account):
+    def with_policy_names(client, entity_filter, list_key):
+        # moto leaves PolicyName out of the entries AWS returns it in
+        for policy in iter_authorization_details(client, entity_filter, list_key):
+            yield {"PolicyName": policy["Arn"].split("/")[-1], **policy}
+
+    with mock.patch(
+        "terraform_aws_migrator.collectors.aws_iam.policy.iter_authorization_details",
+        side_effect=with_policy_names,
+    ):
+        expected = IAMPolicyCollector(iam_account).collect()
+    actual = _collect_without_authorization_details(
+        IAMPolicyCollector, iam_account, "policy"
+    )
+
+    def summary(resources):
+        return [
+            (r["id"], r["arn"], r["details"]["policy_document"])
+            for r in _sorted(resources)
+        ]
+
+    assert summary(actual) == summary(expected)
+    assert [r["id"] for r in expected] == ["shared"]
+
+
+def test_programming_errors_are_not_hidden_by_the_fallback(iam_account, caplog):
+    with mock.patch(
+        "terraform_aws_migrator.collectors.aws_iam.role.iter_authorization_details",
+        side_effect=KeyError("RoleDetailList"),
+    ):
+        assert IAMRoleCollector(iam_account).collect("aws_iam_role") == []
+    assert "Error collecting IAM resources" in caplog.text
+    assert "per-role calls" not in caplog.text
+
+
+def test_user_name_filter_is_read_at_construction(iam_account, monkeypatch):
+    monkeypatch.setenv("TF_AWS_MIGRATOR_IAM_USER_FILTER", "0$")
+    users = IAMUserCollector(iam_account).collect("aws_iam_user")
+    assert [user["id"] for user in users] == ["user0"]
+
+
+def test_invalid_user_name_filter_is_ignored(iam_account, monkeypatch):
+    monkeypatch.setenv("TF_AWS_MIGRATOR_IAM_USER_FILTER", "[invalid")
+    users = IAMUserCollector(iam_account).collect("aws_iam_user")
+    assert sorted(user["id"] for user in users) == ["user0", "user1"]
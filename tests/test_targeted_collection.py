@@ -0,0 +1,189 @@
+# tests/test_targeted_collection.py
+
+import sys
+from unittest import mock
+
+import botocore.client
+import pytest
+
+from terraform_aws_migrator import main as main_module
+from terraform_aws_migrator.auditor import AWSResourceAuditor
+from terraform_aws_migrator.collectors.base import registry
+
+
+@pytest.fixture
+def account(session):
+    """Account with one resource of each targeted type"""
+    ec2 = session.client("ec2")
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    subnet_ids = [
+        ec2.create_subnet(
+            VpcId=vpc_id, CidrBlock=f"10.0.{i}.0/24", AvailabilityZone=f"us-east-1{az}"
+        )["Subnet"]["SubnetId"]
+        for i, az in ((1, "a"), (2, "b"))
+    ]
+
+    elbv2 = session.client("elbv2")
+    lb_arn = elbv2.create_load_balancer(
+        Name="lb1", Subnets=subnet_ids, Tags=[{"Key": "team", "Value": "web"}]
+    )["LoadBalancers"][0]["LoadBalancerArn"]
+    tg_arn = elbv2.create_target_group(
+        Name="tg1", Protocol="HTTP", Port=80, VpcId=vpc_id
+    )["TargetGroups"][0]["TargetGroupArn"]
+    forward = [{"Type": "forward", "TargetGroupArn": tg_arn}]
+    listener_arn = elbv2.create_listener(
+        LoadBalancerArn=lb_arn, Protocol="HTTP", Port=80, DefaultActions=forward
+    )["Listeners"][0]["ListenerArn"]
+    elbv2.create_rule(
+        ListenerArn=listener_arn,
+        Priority=5,
+        Conditions=[{"Field": "path-pattern", "Values": ["/api"]}],
+        Actions=forward,
+    )
+
+    rds = session.client("rds")
+    rds.create_db_instance(
+        DBInstanceIdentifier="db1",
+        DBInstanceClass="db.t3.micro",
+        Engine="postgres",
+        MasterUsername="admin",
+        MasterUserPassword="password123",
+        AllocatedStorage=10,
+    )
+    rds.create_db_cluster(
+        DBClusterIdentifier="cluster1",
+        Engine="aurora-postgresql",
+        MasterUsername="admin",
+        MasterUserPassword="password123",
+    )
+
+    elasticache = session.client("elasticache")
+    elasticache.create_cache_cluster(
+        CacheClusterId="cache1",
+        Engine="redis",
+        CacheNodeType="cache.t3.micro",
+        NumCacheNodes=1,
+    )
+    elasticache.create_replication_group(
+        ReplicationGroupId="group1",
+        ReplicationGroupDescription="group",
+        Engine="redis",
+        CacheNodeType="cache.t3.micro",
+    )
+
+    ecs = session.client("ecs")
+    ecs.create_cluster(clusterName="ecs1")
+    task_definition = ecs.register_task_definition(
+        family="app",
+        containerDefinitions=[{"name": "app", "image": "app", "memory": 128}],
+    )["taskDefinition"]["taskDefinitionArn"]
+    ecs.create_service(
+        cluster="ecs1", serviceName="service1", taskDefinition=task_definition
+    )
+
+    session.client("dynamodb").create_table(
+        TableName="table1",
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    session.client("secretsmanager").create_secret(Name="secret1", SecretString="x")
+    session.client("iam").create_group(GroupName="group1")
+    return session
+
+
+def _collect_unmanaged(resource_type):
+    auditor = AWSResourceAuditor(target_resource_type=resource_type)
+    resources = [
+        resource
+        for collector in auditor._get_relevant_collectors()
+        for resource in collector.collect(target_resource_type=resource_type)
+    ]
+    return auditor._filter_unmanaged_resources(resources, set())
+
+
+@pytest.mark.parametrize(
+    "resource_type, expected_ids",
+    [
+        ("aws_db_instance", ["db1"]),
+        ("aws_rds_cluster", ["cluster1"]),
+        ("aws_elasticache_replication_group", ["group1"]),
+        ("aws_ecs_cluster", ["ecs1"]),
+        ("aws_ecs_service", ["service1"]),
+        ("aws_dynamodb_table", ["table1"]),
+        ("aws_secretsmanager_secret", ["secret1"]),
+        ("aws_iam_group", ["group1"]),
+        ("aws_lb", ["lb1"]),
+    ],
+)
+def test_targeted_collection_returns_the_target_type(
+    account, resource_type, expected_ids
+):
+    unmanaged = _collect_unmanaged(resource_type)
+    assert sorted(resource["id"] for resource in unmanaged) == expected_ids
+    assert {resource["type"] for resource in unmanaged} == {resource_type}
+
+
+@pytest.mark.parametrize(
+    "resource_type",
+    [
+        "aws_elasticache_cluster",
+        "aws_kms_key",
+        "aws_lb_target_group",
+        "aws_lb_listener",
+    ],
+)
+def test_targeted_collection_is_not_filtered_away(account, resource_type):
+    if resource_type == "aws_kms_key":
+        account.client("kms").create_key()
+    unmanaged = _collect_unmanaged(resource_type)
+    assert unmanaged
+    assert {resource["type"] for resource in unmanaged} == {resource_type}
+
+
+def test_listener_rules_are_collected_as_their_own_resources(account):
+    unmanaged = _collect_unmanaged("aws_lb_listener_rule")
+    assert len(unmanaged) == 1
+    rule = unmanaged[0]
+    assert rule["id"] == rule["arn"]
+    assert rule["details"]["priority"] == "5"
+
+
+def test_full_collection_reports_rules_inside_listeners(account):
+    collector = registry.get_collector_class("aws_lb")(account)
+    resources = collector.collect()
+    assert sorted(resource["type"] for resource in resources) == [
+        "aws_lb",
+        "aws_lb_listener",
+        "aws_lb_target_group",
+    ]
+    listener = next(r for r in resources if r["type"] == "aws_lb_listener")
+    assert len(listener["details"]["rules"]) == 1
+
+
+def test_collectors_skip_tag_calls_without_tags(account):
+    calls = []
+    make_api_call = botocore.client.BaseClient._make_api_call
+
+    def record_call(client, operation_name, api_params):
+        calls.append(operation_name)
+        return make_api_call(client, operation_name, api_params)
+
+    collector = registry.get_collector_class("aws_lb")(account, include_tags=False)
+    with mock.patch.object(botocore.client.BaseClient, "_make_api_call", record_call):
+        resources = collector.collect()
+
+    assert resources
+    assert all(resource["tags"] == [] for resource in resources)
+    assert "DescribeTags" not in calls
+    assert "GetResources" not in calls
+
+
+def test_no_tags_flag_disables_tag_collection(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        sys, "argv", ["terraform_aws_migrator", "--tf-dir", str(tmp_path), "--no-tags"]
+    )
+    with mock.patch.object(main_module, "AWSResourceAuditor") as auditor_cls:
+        auditor_cls.return_value.audit_all_resources.return_value = {}
+        assert main_module.main() == 0
+    assert auditor_cls.call_args.kwargs["include_tags"] is False